@@ -6,13 +6,13 @@
 
 import hmac
 import hashlib
+import threading
 import time
 import requests
 from urllib.parse import urlencode
 from typing import Dict, Any, Optional, List
 import logging
 from datetime import datetime
-import json
 
 
 class APIClient:
@@ -42,12 +42,18 @@ class APIClient:
         self.request_timeout = 10
         self.max_retries = 3
         self.retry_delay = 1
+        self.max_retry_delay = 30
         
         # 请求统计
         self.request_count = 0
         self.error_count = 0
         self.last_request_time = 0
         
+        # 请求频率限制：多个线程共享同一客户端时（如 asyncio.to_thread 并发调用），
+        # 检查、等待与更新须在同一把锁内完成，保证相邻请求间隔不少于 min_request_interval
+        self.min_request_interval = 0.1
+        self._throttle_lock = threading.Lock()
+        
         self.logger.info(f"🔗 初始化{exchange}API客户端 (测试网: {testnet})")
     
     def _generate_signature(self, query_string: str) -> str:
@@ -104,6 +110,14 @@ class APIClient:
         
         return headers
     
+    def _throttle(self):
+        """等待到距上次请求至少 min_request_interval 秒，并占用本次请求的时间点"""
+        with self._throttle_lock:
+            wait = self.min_request_interval - (time.time() - self.last_request_time)
+            if wait > 0:
+                time.sleep(wait)
+            self.last_request_time = time.time()
+    
     def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, 
                      signed: bool = False, retries: int = 0) -> Dict[str, Any]:
         """
@@ -119,80 +133,75 @@ class APIClient:
         Returns:
             响应数据
         """
-        if params is None:
-            params = {}
-        
-        # 添加时间戳（如果需要签名）
-        if signed:
-            params['timestamp'] = int(time.time() * 1000)
-        
-        # 生成查询字符串和签名
-        query_string = urlencode(params) if params else ''
-        if signed and query_string:
-            signature = self._generate_signature(query_string)
-            params['signature'] = signature
-            query_string = urlencode(params)
-        
-        # 构建完整URL
-        url = f"{self.base_url}{endpoint}"
-        if method == 'GET' and query_string:
-            url += f"?{query_string}"
+        base_params = dict(params) if params else {}
+        attempt = retries
         
-        # 准备请求头
-        headers = self._prepare_headers(signed)
-        
-        # 请求限制检查
-        current_time = time.time()
-        if current_time - self.last_request_time < 0.1:  # 100ms限制
-            time.sleep(0.1)
-        
-        try:
-            self.logger.debug(f"📡 API请求: {method} {endpoint}")
+        # 迭代重试（代替递归），每次重试都基于原始参数重新生成时间戳和签名
+        while True:
+            # 请求限制检查（在签名前等待，避免排队后时间戳过期）
+            self._throttle()
             
-            # 发送请求
-            if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=self.request_timeout)
-            elif method == 'POST':
-                response = requests.post(url, headers=headers, json=params if method == 'POST' else None, 
-                                       timeout=self.request_timeout)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=self.request_timeout)
-            else:
-                raise ValueError(f"不支持的HTTP方法: {method}")
+            params = dict(base_params)
             
-            self.last_request_time = time.time()
-            self.request_count += 1
+            # 添加时间戳（如果需要签名）
+            if signed:
+                params['timestamp'] = int(time.time() * 1000)
             
-            # 检查响应状态
-            if response.status_code == 200:
-                data = response.json()
-                self.logger.debug(f"✅ API响应成功: {endpoint}")
-                return data
-            else:
-                error_msg = f"API请求失败: {response.status_code} - {response.text}"
-                self.logger.error(error_msg)
-                self.error_count += 1
+            # 生成查询字符串和签名
+            query_string = urlencode(params) if params else ''
+            if signed and query_string:
+                signature = self._generate_signature(query_string)
+                params['signature'] = signature
+                query_string = urlencode(params)
+            
+            # 构建完整URL
+            url = f"{self.base_url}{endpoint}"
+            if method == 'GET' and query_string:
+                url += f"?{query_string}"
+            
+            # 准备请求头
+            headers = self._prepare_headers(signed)
+            
+            try:
+                self.logger.debug("📡 API请求: %s %s", method, endpoint)
                 
-                # 重试逻辑
-                if retries < self.max_retries and response.status_code in [429, 500, 502, 503, 504]:
-                    self.logger.warning(f"🔄 重试请求 ({retries + 1}/{self.max_retries})")
-                    time.sleep(self.retry_delay * (retries + 1))
-                    return self._make_request(method, endpoint, params, signed, retries + 1)
+                # 发送请求
+                if method == 'GET':
+                    response = requests.get(url, headers=headers, timeout=self.request_timeout)
+                elif method == 'POST':
+                    response = requests.post(url, headers=headers, json=params if method == 'POST' else None, 
+                                           timeout=self.request_timeout)
+                elif method == 'DELETE':
+                    response = requests.delete(url, headers=headers, timeout=self.request_timeout)
+                else:
+                    raise ValueError(f"不支持的HTTP方法: {method}")
                 
-                raise Exception(error_msg)
+                self.last_request_time = time.time()
+                self.request_count += 1
                 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"网络请求异常: {str(e)}"
+                # 检查响应状态
+                if response.status_code == 200:
+                    data = response.json()
+                    self.logger.debug("✅ API响应成功: %s", endpoint)
+                    return data
+                
+                error_msg = f"API请求失败: {response.status_code} - {response.text}"
+                retryable = response.status_code in [429, 500, 502, 503, 504]
+                
+            except requests.exceptions.RequestException as e:
+                error_msg = f"网络请求异常: {str(e)}"
+                retryable = True
+            
             self.logger.error(error_msg)
             self.error_count += 1
             
-            # 重试逻辑
-            if retries < self.max_retries:
-                self.logger.warning(f"🔄 重试请求 ({retries + 1}/{self.max_retries})")
-                time.sleep(self.retry_delay * (retries + 1))
-                return self._make_request(method, endpoint, params, signed, retries + 1)
+            # 重试逻辑：指数退避，最长等待 max_retry_delay 秒
+            if not retryable or attempt >= self.max_retries:
+                raise Exception(error_msg)
             
-            raise Exception(error_msg)
+            attempt += 1
+            self.logger.warning("🔄 重试请求 (%d/%d)", attempt, self.max_retries)
+            time.sleep(min(self.retry_delay * 2 ** (attempt - 1), self.max_retry_delay))
     
     # ==================== 账户相关API ====================
     
@@ -310,7 +319,7 @@ class APIClient:
         # 添加其他参数
         params.update(kwargs)
         
-        self.logger.info(f"📝 下单: {side} {quantity} {symbol} @ {price or 'MARKET'}")
+        self.logger.info("📝 下单: %s %s %s @ %s", side, quantity, symbol, price or 'MARKET')
         
         if self.exchange == 'binance':
             return self._make_request('POST', '/api/v3/order', params, signed=True)
@@ -334,7 +343,7 @@ class APIClient:
             'orderId': order_id
         }
         
-        self.logger.info(f"❌ 取消订单: {order_id}")
+        self.logger.info("❌ 取消订单: %s", order_id)
         
         if self.exchange == 'binance':
             return self._make_request('DELETE', '/api/v3/order', params, signed=True)
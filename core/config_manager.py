@@ -328,15 +328,19 @@ class ConfigManager:
     
     def list_configs(self) -> List[str]:
         """列出所有可用配置"""
-        configs = []
-        for file_path in self.config_dir.glob('*.yaml'):
-            configs.append(file_path.stem)
-        for file_path in self.config_dir.glob('*.yml'):
-            configs.append(file_path.stem)
-        for file_path in self.config_dir.glob('*.json'):
-            configs.append(file_path.stem)
-        
-        return sorted(list(set(configs)))
+        configs = set()
+        
+        # 单次遍历目录，按扩展名过滤（代替每种扩展名各做一次glob）
+        try:
+            with os.scandir(self.config_dir) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext in ('.yaml', '.yml', '.json') and entry.is_file():
+                        configs.add(stem)
+        except FileNotFoundError:
+            pass
+        
+        return sorted(configs)
     
     def validate_api_credentials(self, config_name: str) -> bool:
         """
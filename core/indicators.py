@@ -154,32 +154,33 @@ class TechnicalIndicators:
                 'volume_period': 20
             }
         
-        result = data.copy()
+        # 指标列先收集到字典，最后一次性拼接，避免逐列插入DataFrame的开销
+        columns = {}
         
         try:
             # 趋势指标
             for period in config['ema_periods']:
-                result[f'ema_{period}'] = TechnicalIndicators.calculate_ema(data['close'], period)
+                columns[f'ema_{period}'] = TechnicalIndicators.calculate_ema(data['close'], period)
             
             # 布林带
             bb_data = TechnicalIndicators.calculate_bollinger_bands(
                 data['close'], config['bb_period'], config['bb_std']
             )
             for key, value in bb_data.items():
-                result[key] = value
+                columns[key] = value
             
             # RSI
-            result['rsi'] = TechnicalIndicators.calculate_rsi(data['close'], config['rsi_period'])
+            columns['rsi'] = TechnicalIndicators.calculate_rsi(data['close'], config['rsi_period'])
             
             # MACD
             macd_data = TechnicalIndicators.calculate_macd(
                 data['close'], config['macd_fast'], config['macd_slow'], config['macd_signal']
             )
             for key, value in macd_data.items():
-                result[key] = value
+                columns[key] = value
             
             # ATR
-            result['atr'] = TechnicalIndicators.calculate_atr(
+            columns['atr'] = TechnicalIndicators.calculate_atr(
                 data['high'], data['low'], data['close'], config['atr_period']
             )
             
@@ -189,21 +190,27 @@ class TechnicalIndicators:
                     data['volume'], config['volume_period']
                 )
                 for key, value in volume_data.items():
-                    result[key] = value
+                    columns[key] = value
             
             # 动量指标
             momentum_data = TechnicalIndicators.calculate_momentum_indicators(data['close'])
             for key, value in momentum_data.items():
-                result[key] = value
+                columns[key] = value
             
             # 趋势指标
             trend_data = TechnicalIndicators.calculate_trend_indicators(data['close'])
             for key, value in trend_data.items():
-                result[key] = value
+                columns[key] = value
             
         except Exception as e:
             print(f"⚠️  指标计算警告: {str(e)}")
         
+        # 与原始列同名的指标覆盖原列
+        result = pd.concat([
+            data.drop(columns=[name for name in columns if name in data.columns]),
+            pd.DataFrame(columns, index=data.index)
+        ], axis=1)
+        
         return result
     
     @staticmethod
@@ -229,36 +236,41 @@ class TechnicalIndicators:
         
         try:
             # 趋势信号
+            # 各条件直接在ndarray上计算，避免生成中间Series
             trend_signal = 0
             if all(col in data.columns for col in ['ema_8', 'ema_21', 'ema_55']):
-                trend_conditions = [
-                    data['ema_8'] > data['ema_21'],
-                    data['ema_21'] > data['ema_55'],
-                    data['close'] > data['bb_middle']
-                ]
-                trend_signal = (sum(trend_conditions) / len(trend_conditions) - 0.5) * 2
+                ema_8 = data['ema_8'].to_numpy()
+                ema_21 = data['ema_21'].to_numpy()
+                ema_55 = data['ema_55'].to_numpy()
+                trend_count = (
+                    (ema_8 > ema_21).astype(np.int8) +
+                    (ema_21 > ema_55) +
+                    (data['close'].to_numpy() > data['bb_middle'].to_numpy())
+                )
+                trend_signal = (trend_count / 3 - 0.5) * 2
             
             # 动量信号
             momentum_signal = 0
             if 'rsi' in data.columns and 'macd' in data.columns:
-                rsi_signal = np.where(
-                    (data['rsi'] > 30) & (data['rsi'] < 70), 
-                    (data['rsi'] - 50) / 50, 0
-                )
+                rsi = data['rsi'].to_numpy()
+                rsi_signal = np.where((rsi > 30) & (rsi < 70), (rsi - 50) / 50, 0)
                 macd_signal = np.where(
-                    data['macd'] > data['macd_signal'], 0.5, -0.5
+                    data['macd'].to_numpy() > data['macd_signal'].to_numpy(), 0.5, -0.5
                 )
                 momentum_signal = (rsi_signal + macd_signal) / 2
             
             # 成交量信号
             volume_signal = 0
             if 'volume_ratio' in data.columns:
-                volume_signal = np.where(data['volume_ratio'] > 1.5, 0.5, 0)
+                volume_signal = np.where(data['volume_ratio'].to_numpy() > 1.5, 0.5, 0)
             
             # 波动率信号
             volatility_signal = 0
             if 'bb_width' in data.columns:
-                volatility_signal = np.where(data['bb_width'] > data['bb_width'].rolling(20).mean(), 0.3, -0.3)
+                bb_width = data['bb_width']
+                volatility_signal = np.where(
+                    bb_width.to_numpy() > bb_width.rolling(20).mean().to_numpy(), 0.3, -0.3
+                )
             
             # 综合信号
             total_signal = (
@@ -284,9 +296,9 @@ def get_trading_signal(data: pd.DataFrame, threshold: float = 0.3) -> pd.Series:
     """便捷函数：获取交易信号"""
     signal_strength = TechnicalIndicators.get_signal_strength(data)
     
+    strength = signal_strength.to_numpy()
     return pd.Series(
-        np.where(signal_strength > threshold, 1,
-                np.where(signal_strength < -threshold, -1, 0)),
+        np.select([strength > threshold, strength < -threshold], [1, -1], 0),
         index=data.index
     )
 
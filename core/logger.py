@@ -4,10 +4,15 @@
 支持多种输出方式：文件、控制台、远程日志服务
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
+import time
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -62,9 +67,38 @@ class TradingLogFilter(logging.Filter):
         return True
 
 
+# 存活的日志管理器（弱引用，不阻止实例回收），进程退出时统一刷新缓冲并停止后台线程
+_live_managers: "weakref.WeakSet[LoggerManager]" = weakref.WeakSet()
+
+
+def _shutdown_live_managers():
+    """进程退出时刷新所有日志管理器"""
+    for manager in list(_live_managers):
+        manager.stop_structured_flusher()
+        manager.stop_queue_listeners()
+
+
+def _structured_flush_loop(manager_ref: "weakref.ref[LoggerManager]", stop_event: threading.Event,
+                           interval: float):
+    """结构化日志后台刷新线程：每隔 interval 秒刷新一次缓冲（仅持有弱引用，不阻止管理器回收）"""
+    while not stop_event.wait(interval):
+        manager = manager_ref()
+        if manager is None:
+            return
+        if manager._structured_pending:
+            manager.flush_structured_logs()
+        del manager
+
+
+atexit.register(_shutdown_live_managers)
+
+
 class LoggerManager:
     """统一日志管理器"""
     
+    # 订单/成交/错误属于交易审计记录，不经缓冲直接落盘
+    STRUCTURED_WRITE_THROUGH = {'order', 'fill', 'error', 'exception'}
+    
     def __init__(self, name: str = "TradeFan", log_dir: str = "logs", 
                  config: Optional[Dict[str, Any]] = None):
         """
@@ -79,6 +113,7 @@ class LoggerManager:
         self.log_dir = Path(log_dir)
         self.config = config or {}
         self.loggers = {}  # 缓存创建的日志器
+        self._queue_listeners: List[logging.handlers.QueueListener] = []  # 后台写日志线程
         
         # 创建日志目录
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -92,11 +127,24 @@ class LoggerManager:
             'file_backup_count': 5,
             'console_output': True,
             'file_output': True,
-            'colored_output': True
+            'colored_output': True,
+            'queue_output': False,  # 文件日志经队列由后台线程写入，调用方不阻塞在磁盘I/O上
+            'structured_buffer_size': 256,  # 结构化日志缓冲条数
+            'structured_flush_interval': 0.5  # 结构化日志最长缓冲时间（秒）
         }
         
         # 合并配置
         self.effective_config = {**self.default_config, **self.config}
+        
+        # 结构化日志缓冲：按文件聚合，达到条数或时间阈值后批量写入
+        self._structured_buffer: Dict[Path, List[str]] = {}
+        self._structured_pending = 0
+        self._structured_last_flush = time.monotonic()
+        self._structured_lock = threading.Lock()
+        # 后台刷新线程首次缓冲时启动，保证缓冲时间不超过阈值
+        self._structured_flusher: Optional[threading.Thread] = None
+        self._structured_stop = threading.Event()
+        _live_managers.add(self)
     
     def create_logger(self, logger_name: str, module_name: str = None, 
                      custom_config: Optional[Dict[str, Any]] = None) -> logging.Logger:
@@ -154,6 +202,8 @@ class LoggerManager:
         
         # 文件输出
         if config['file_output']:
+            file_handlers = []
+            
             # 主日志文件
             log_file = self.log_dir / f"{logger_name}_{datetime.now().strftime('%Y%m%d')}.log"
             file_handler = logging.handlers.RotatingFileHandler(
@@ -164,7 +214,7 @@ class LoggerManager:
             )
             file_handler.setLevel(getattr(logging, config['level'].upper()))
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            file_handlers.append(file_handler)
             
             # 错误日志文件
             error_log_file = self.log_dir / f"{logger_name}_error_{datetime.now().strftime('%Y%m%d')}.log"
@@ -176,7 +226,20 @@ class LoggerManager:
             )
             error_handler.setLevel(logging.ERROR)
             error_handler.setFormatter(formatter)
-            logger.addHandler(error_handler)
+            file_handlers.append(error_handler)
+            
+            if config['queue_output']:
+                # 日志记录放入队列，由监听线程写入文件
+                log_queue = queue.SimpleQueue()
+                listener = logging.handlers.QueueListener(
+                    log_queue, *file_handlers, respect_handler_level=True
+                )
+                listener.start()
+                self._queue_listeners.append(listener)
+                logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            else:
+                for handler in file_handlers:
+                    logger.addHandler(handler)
         
         # 添加过滤器
         if 'filters' in config:
@@ -281,6 +344,11 @@ class LoggerManager:
         
         level = level_map.get(event_type, logging.INFO)
         
+        # 级别未启用时跳过消息格式化，结构化数据照常记录
+        if not logger.isEnabledFor(level):
+            self._log_structured_data(event_type, log_data)
+            return
+        
         # 格式化消息
         if event_type == 'signal':
             message = f"📊 交易信号 | {symbol} | {data.get('signal', 'N/A')} | 价格: {data.get('price', 'N/A')}"
@@ -299,17 +367,71 @@ class LoggerManager:
         self._log_structured_data(event_type, log_data)
     
     def _log_structured_data(self, event_type: str, data: Dict[str, Any]):
-        """记录结构化数据到JSON文件"""
+        """记录结构化数据到JSON文件（先写入缓冲，批量落盘）"""
         try:
             json_log_file = self.log_dir / f"structured_{event_type}_{datetime.now().strftime('%Y%m%d')}.jsonl"
             
-            with open(json_log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(data, ensure_ascii=False) + '\n')
+            line = json.dumps(data, ensure_ascii=False) + '\n'
+            flush_interval = self.effective_config['structured_flush_interval']
+            
+            with self._structured_lock:
+                self._structured_buffer.setdefault(json_log_file, []).append(line)
+                self._structured_pending += 1
+                
+                # 刷新线程停止后（进程退出阶段）不再缓冲，直接落盘
+                flush_now = (event_type in self.STRUCTURED_WRITE_THROUGH or
+                             self._structured_stop.is_set() or
+                             self._structured_pending >= self.effective_config['structured_buffer_size'] or
+                             time.monotonic() - self._structured_last_flush >= flush_interval)
+                
+                # 没有后续事件时由后台刷新线程在阈值时间内落盘
+                if not flush_now and self._structured_flusher is None:
+                    self._structured_flusher = threading.Thread(
+                        target=_structured_flush_loop,
+                        args=(weakref.ref(self), self._structured_stop, flush_interval),
+                        name=f"{self.name}-structured-flush",
+                        daemon=True
+                    )
+                    self._structured_flusher.start()
+            
+            if flush_now:
+                self.flush_structured_logs()
                 
         except Exception as e:
             # 避免日志记录本身出错影响主程序
             print(f"结构化日志记录失败: {e}")
     
+    def stop_queue_listeners(self):
+        """停止后台写日志线程，写完队列中剩余的日志"""
+        for listener in self._queue_listeners:
+            listener.stop()
+        self._queue_listeners.clear()
+    
+    def stop_structured_flusher(self):
+        """停止结构化日志后台刷新线程并写入剩余缓冲，之后的结构化日志直接落盘"""
+        self._structured_stop.set()
+        flusher = self._structured_flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        self.flush_structured_logs()
+    
+    def flush_structured_logs(self):
+        """将缓冲的结构化日志写入文件，每个文件只打开一次"""
+        # 写入也在锁内完成，保证刷新线程与调用线程的批次按顺序落盘
+        with self._structured_lock:
+            buffer = self._structured_buffer
+            self._structured_buffer = {}
+            self._structured_pending = 0
+            self._structured_last_flush = time.monotonic()
+            
+            for json_log_file, lines in buffer.items():
+                try:
+                    with open(json_log_file, 'a', encoding='utf-8') as f:
+                        f.writelines(lines)
+                except Exception as e:
+                    # 避免日志记录本身出错影响主程序
+                    print(f"结构化日志记录失败: {e}")
+    
     def log_exception(self, logger: logging.Logger, exception: Exception, 
                      context: str = None):
         """
@@ -405,11 +527,12 @@ class LoggerManager:
         
         try:
             for log_file in self.log_dir.glob("*.log*"):
-                file_size = log_file.stat().st_size
+                file_stat = log_file.stat()  # 每个文件只stat一次
+                file_size = file_stat.st_size
                 stats['log_files'].append({
                     'name': log_file.name,
                     'size': file_size,
-                    'modified': datetime.fromtimestamp(log_file.stat().st_mtime).isoformat()
+                    'modified': datetime.fromtimestamp(file_stat.st_mtime).isoformat()
                 })
                 stats['total_size'] += file_size
             
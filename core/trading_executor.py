@@ -10,7 +10,6 @@ from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
-import numpy as np
 from enum import Enum
 
 from .api_client import APIClient
@@ -106,10 +105,13 @@ class TradingExecutor(ABC):
         self.state = TradingState.STOPPED
         self.start_time = None
         self.last_update_time = None
+        self._stop_done: Optional[asyncio.Event] = None  # 停止流程完成事件，仅在停止时创建
         
         # 持仓管理
         self.positions: Dict[str, Position] = {}
         self.orders: Dict[str, Dict] = {}
+        self._exchange_info_cache: Dict[str, Dict] = {}  # 交易对规则缓存，会话内不变
+        self._last_prices: Dict[str, Tuple[float, float]] = {}  # 最新价格缓存: symbol -> (价格, 获取时刻)
         
         # 统计信息
         self.stats = {
@@ -122,11 +124,22 @@ class TradingExecutor(ABC):
             'consecutive_losses': 0,
             'last_trade_time': None
         }
+        self._last_logged_trades = 0  # 上次输出统计日志时的总交易数
         
         # 风险控制
         self.risk_limits = self.config.get('risk_management', {})
         self.daily_loss_limit = self.risk_limits.get('max_daily_loss', 0.02)
         self.position_risk_limit = self.risk_limits.get('max_position_risk', 0.01)
+        self.max_consecutive_losses = self.risk_limits.get('max_consecutive_losses', 5)
+        self.stop_loss = self.risk_limits.get('stop_loss', 0.02)
+        self.take_profit = self.risk_limits.get('take_profit', 0.04)
+        
+        # 交易参数（配置加载后不再变化，预先取出避免热路径上重复查字典）
+        trading_config = self.config.get('trading', {})
+        self.base_currency = trading_config.get('base_currency', 'USDT')
+        self.max_positions = trading_config.get('max_positions', 5)
+        self.position_size_ratio = trading_config.get('position_size_ratio', 0.1)
+        self.price_max_age = trading_config.get('price_max_age', 5.0)  # 缓存价格有效期（秒）
         
         self.logger.info(f"🚀 交易执行器初始化完成: {self.__class__.__name__}")
     
@@ -181,12 +194,12 @@ class TradingExecutor(ABC):
         self.state = TradingState.STARTING
         
         try:
-            # 验证API连接
-            if not self.api_client.test_connectivity():
+            # 验证API连接（同步HTTP调用放到线程中执行，避免阻塞事件循环）
+            if not await asyncio.to_thread(self.api_client.test_connectivity):
                 raise Exception("API连接测试失败")
             
             # 验证账户权限
-            account_info = self.api_client.get_account_info()
+            account_info = await asyncio.to_thread(self.api_client.get_account_info)
             self.logger.info(f"✅ 账户验证成功: {account_info.get('accountType', 'Unknown')}")
             
             # 初始化持仓
@@ -211,8 +224,14 @@ class TradingExecutor(ABC):
         if self.state == TradingState.STOPPED:
             return
         
+        # 已有停止流程在执行时等待其完成，避免并发调用重复撤单
+        if self.state == TradingState.STOPPING and self._stop_done is not None:
+            await self._stop_done.wait()
+            return
+        
         self.logger.info("🛑 停止交易系统...")
         self.state = TradingState.STOPPING
+        self._stop_done = asyncio.Event()
         
         try:
             # 取消所有未成交订单
@@ -220,12 +239,18 @@ class TradingExecutor(ABC):
             
             # 记录最终统计
             self._log_final_stats()
+            self.logger_manager.flush_structured_logs()
             
             self.state = TradingState.STOPPED
             self.logger.info("✅ 交易系统已停止")
             
         except Exception as e:
             self.logger_manager.log_exception(self.logger, e, "停止交易系统")
+        finally:
+            # 停止流程失败或被取消时不能停留在 STOPPING，否则后续启动/停止会一直等待或跳过
+            if self.state == TradingState.STOPPING:
+                self.state = TradingState.ERROR
+            self._stop_done.set()
     
     async def _trading_loop(self):
         """主交易循环"""
@@ -234,13 +259,13 @@ class TradingExecutor(ABC):
         
         while self.state == TradingState.RUNNING:
             try:
-                loop_start_time = time.time()
+                loop_start_time = time.perf_counter()
                 
                 # 更新市场数据和持仓
                 await self._update_positions()
                 
-                # 风险检查
-                if not self._check_risk_limits():
+                # 风险检查（内部会查询账户余额，放到线程中执行）
+                if not await asyncio.to_thread(self._check_risk_limits):
                     self.logger.warning("⚠️ 触发风险限制，暂停交易")
                     self.state = TradingState.PAUSED
                     await asyncio.sleep(300)  # 暂停5分钟
@@ -260,8 +285,8 @@ class TradingExecutor(ABC):
                 self._update_stats()
                 
                 # 计算循环耗时
-                loop_time = time.time() - loop_start_time
-                self.logger.debug(f"⏱️ 交易循环耗时: {loop_time:.2f}秒")
+                loop_time = time.perf_counter() - loop_start_time
+                self.logger.debug("⏱️ 交易循环耗时: %.2f秒", loop_time)
                 
                 # 等待下次更新
                 sleep_time = max(0, update_interval - loop_time)
@@ -298,7 +323,7 @@ class TradingExecutor(ABC):
             return
         
         # 计算仓位大小
-        position_size = self._calculate_position_size(symbol, signal)
+        position_size = await self._calculate_position_size(symbol, signal)
         if position_size <= 0:
             return
         
@@ -325,20 +350,18 @@ class TradingExecutor(ABC):
                 return False
         
         # 检查最大持仓数量
-        max_positions = self.config['trading'].get('max_positions', 5)
-        if len(self.positions) >= max_positions:
-            self.logger.warning(f"⚠️ 已达到最大持仓数量: {max_positions}")
+        if len(self.positions) >= self.max_positions:
+            self.logger.warning(f"⚠️ 已达到最大持仓数量: {self.max_positions}")
             return False
         
         # 检查连续亏损限制
-        max_consecutive_losses = self.risk_limits.get('max_consecutive_losses', 5)
-        if self.stats['consecutive_losses'] >= max_consecutive_losses:
+        if self.stats['consecutive_losses'] >= self.max_consecutive_losses:
             self.logger.warning(f"⚠️ 连续亏损次数过多: {self.stats['consecutive_losses']}")
             return False
         
         return True
     
-    def _calculate_position_size(self, symbol: str, signal: int) -> float:
+    async def _calculate_position_size(self, symbol: str, signal: int) -> float:
         """
         计算仓位大小
         
@@ -350,18 +373,21 @@ class TradingExecutor(ABC):
             仓位大小
         """
         try:
-            # 获取账户余额
-            base_currency = self.config['trading']['base_currency']
-            balance_info = self.api_client.get_balance(base_currency)
+            # 优先使用本轮持仓更新时拿到的价格，过期或没有时再请求行情
+            current_price = self._get_cached_price(symbol)
+            if current_price is None:
+                # 并发获取账户余额和当前价格（同步HTTP调用放到线程中执行）
+                balance_info, ticker = await asyncio.gather(
+                    asyncio.to_thread(self.api_client.get_balance, self.base_currency),
+                    asyncio.to_thread(self.api_client.get_ticker, symbol)
+                )
+                current_price = float(ticker['lastPrice'])
+            else:
+                balance_info = await asyncio.to_thread(self.api_client.get_balance, self.base_currency)
             available_balance = balance_info.get('free', 0)
             
-            # 获取当前价格
-            ticker = self.api_client.get_ticker(symbol)
-            current_price = float(ticker['lastPrice'])
-            
             # 计算仓位大小
-            position_ratio = self.config['trading'].get('position_size_ratio', 0.1)
-            max_position_value = available_balance * position_ratio
+            max_position_value = available_balance * self.position_size_ratio
             
             # 考虑风险限制
             risk_adjusted_value = min(
@@ -372,7 +398,7 @@ class TradingExecutor(ABC):
             position_size = risk_adjusted_value / current_price
             
             # 获取交易对信息进行精度调整
-            exchange_info = self.api_client.get_exchange_info(symbol)
+            exchange_info = await self._get_exchange_info(symbol)
             # 这里需要根据具体交易所调整精度逻辑
             
             return round(position_size, 6)  # 临时使用6位小数
@@ -381,6 +407,43 @@ class TradingExecutor(ABC):
             self.logger_manager.log_exception(self.logger, e, f"计算仓位大小 {symbol}")
             return 0.0
     
+    def _get_cached_price(self, symbol: str) -> Optional[float]:
+        """
+        获取缓存的最新价格
+        
+        Args:
+            symbol: 交易对
+            
+        Returns:
+            未过期的缓存价格，没有或已过期时返回None
+        """
+        cached = self._last_prices.get(symbol)
+        if cached is None:
+            return None
+        
+        price, fetched_at = cached
+        if time.monotonic() - fetched_at > self.price_max_age:
+            return None
+        return price
+    
+    async def _get_exchange_info(self, symbol: str) -> Dict[str, Any]:
+        """
+        获取交易对规则信息（带缓存）
+        
+        交易规则在会话内基本不变，首次请求后缓存，避免每次下单都请求交易所
+        
+        Args:
+            symbol: 交易对
+            
+        Returns:
+            交易对规则信息
+        """
+        exchange_info = self._exchange_info_cache.get(symbol)
+        if exchange_info is None:
+            exchange_info = await asyncio.to_thread(self.api_client.get_exchange_info, symbol)
+            self._exchange_info_cache[symbol] = exchange_info
+        return exchange_info
+    
     async def _execute_trade(self, symbol: str, signal: int, position_size: float, 
                            signal_data: Dict[str, Any]):
         """
@@ -399,8 +462,9 @@ class TradingExecutor(ABC):
             if symbol in self.positions:
                 await self._close_position(symbol, "信号反转")
             
-            # 下市价单
-            order_result = self.api_client.place_order(
+            # 下市价单（同步HTTP调用放到线程中执行，避免阻塞事件循环）
+            order_result = await asyncio.to_thread(
+                self.api_client.place_order,
                 symbol=symbol,
                 side=side,
                 order_type='MARKET',
@@ -442,9 +506,9 @@ class TradingExecutor(ABC):
             order_id: 订单ID
             timeout: 超时时间（秒）
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        while time.time() - start_time < timeout:
+        while time.perf_counter() - start_time < timeout:
             try:
                 order_info = self.orders.get(order_id, {})
                 symbol = order_info.get('symbol')
@@ -453,7 +517,7 @@ class TradingExecutor(ABC):
                     break
                 
                 # 查询订单状态
-                order_status = self.api_client.get_order_status(symbol, order_id)
+                order_status = await asyncio.to_thread(self.api_client.get_order_status, symbol, order_id)
                 status = order_status.get('status')
                 
                 if status == 'FILLED':
@@ -539,7 +603,8 @@ class TradingExecutor(ABC):
             close_side = 'SELL' if position.side == 'long' else 'BUY'
             
             # 下市价平仓单
-            order_result = self.api_client.place_order(
+            order_result = await asyncio.to_thread(
+                self.api_client.place_order,
                 symbol=symbol,
                 side=close_side,
                 order_type='MARKET',
@@ -566,11 +631,11 @@ class TradingExecutor(ABC):
     
     async def _wait_for_position_close(self, order_id: str, symbol: str):
         """等待平仓订单成交"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        while time.time() - start_time < 30:  # 30秒超时
+        while time.perf_counter() - start_time < 30:  # 30秒超时
             try:
-                order_status = self.api_client.get_order_status(symbol, order_id)
+                order_status = await asyncio.to_thread(self.api_client.get_order_status, symbol, order_id)
                 status = order_status.get('status')
                 
                 if status == 'FILLED':
@@ -630,11 +695,27 @@ class TradingExecutor(ABC):
     
     async def _update_positions(self):
         """更新持仓信息"""
-        for symbol, position in self.positions.items():
+        # 快照持仓列表：止损止盈平仓会在遍历过程中删除持仓
+        symbols = list(self.positions.keys())
+        
+        # 并发获取所有持仓的行情，总耗时取决于最慢的一次请求而不是所有请求之和
+        tickers = await asyncio.gather(
+            *(asyncio.to_thread(self.api_client.get_ticker, symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+        
+        for symbol, ticker in zip(symbols, tickers):
+            position = self.positions.get(symbol)
+            if position is None:
+                continue
+            
             try:
+                if isinstance(ticker, Exception):
+                    raise ticker
+                
                 # 获取当前价格
-                ticker = self.api_client.get_ticker(symbol)
                 current_price = float(ticker['lastPrice'])
+                self._last_prices[symbol] = (current_price, time.monotonic())
                 
                 # 更新持仓价格和盈亏
                 position.update_price(current_price)
@@ -656,14 +737,12 @@ class TradingExecutor(ABC):
         pnl_ratio = position.get_pnl_ratio()
         
         # 止损检查
-        stop_loss = self.risk_limits.get('stop_loss', 0.02)
-        if pnl_ratio <= -stop_loss:
+        if pnl_ratio <= -self.stop_loss:
             await self._close_position(symbol, f"止损触发 (亏损{pnl_ratio:.2%})")
             return
         
         # 止盈检查
-        take_profit = self.risk_limits.get('take_profit', 0.04)
-        if pnl_ratio >= take_profit:
+        if pnl_ratio >= self.take_profit:
             await self._close_position(symbol, f"止盈触发 (盈利{pnl_ratio:.2%})")
             return
     
@@ -675,8 +754,7 @@ class TradingExecutor(ABC):
             return False
         
         # 检查连续亏损
-        max_consecutive_losses = self.risk_limits.get('max_consecutive_losses', 5)
-        if self.stats['consecutive_losses'] >= max_consecutive_losses:
+        if self.stats['consecutive_losses'] >= self.max_consecutive_losses:
             self.risk_logger.warning(f"⚠️ 连续亏损过多: {self.stats['consecutive_losses']}")
             return False
         
@@ -685,8 +763,7 @@ class TradingExecutor(ABC):
     def _get_account_balance(self) -> float:
         """获取账户余额"""
         try:
-            base_currency = self.config['trading']['base_currency']
-            balance_info = self.api_client.get_balance(base_currency)
+            balance_info = self.api_client.get_balance(self.base_currency)
             return balance_info.get('total', 0)
         except:
             return 10000  # 默认值
@@ -694,14 +771,21 @@ class TradingExecutor(ABC):
     async def _cancel_all_orders(self):
         """取消所有未成交订单"""
         try:
-            open_orders = self.api_client.get_open_orders()
+            open_orders = await asyncio.to_thread(self.api_client.get_open_orders)
+            targets = [(order.get('symbol'), order.get('orderId')) for order in open_orders
+                       if order.get('orderId') and order.get('symbol')]
+            
+            # 各订单相互独立，并发撤单，总耗时取决于最慢的一次请求
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self.api_client.cancel_order, symbol, order_id)
+                  for symbol, order_id in targets),
+                return_exceptions=True
+            )
             
-            for order in open_orders:
-                order_id = order.get('orderId')
-                symbol = order.get('symbol')
-                
-                if order_id and symbol:
-                    self.api_client.cancel_order(symbol, order_id)
+            for (symbol, order_id), result in zip(targets, results):
+                if isinstance(result, Exception):
+                    self.logger_manager.log_exception(self.logger, result, f"取消订单 {symbol} {order_id}")
+                else:
                     self.logger.info(f"❌ 取消订单: {order_id}")
             
         except Exception as e:
@@ -719,8 +803,9 @@ class TradingExecutor(ABC):
         # 计算最大回撤
         # 这里需要更复杂的逻辑来跟踪历史净值
         
-        # 记录统计信息
-        if self.stats['total_trades'] % 10 == 0:  # 每10笔交易记录一次
+        # 记录统计信息：每新增10笔交易汇总记录一次，避免交易数不变时每轮循环重复输出
+        if self.stats['total_trades'] - self._last_logged_trades >= 10:
+            self._last_logged_trades = self.stats['total_trades']
             self.logger.info(f"📊 交易统计 - 总交易: {self.stats['total_trades']}, "
                            f"胜率: {win_rate:.2%}, 总盈亏: {self.stats['total_pnl']:.4f}")
     
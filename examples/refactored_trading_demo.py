@@ -85,7 +85,7 @@ class SimpleTrendStrategy(TradingExecutor):
             interval = interval_map.get(timeframe, '1h')
             
             # 获取K线数据
-            klines = self.api_client.get_klines(symbol, interval, limit)
+            klines = await asyncio.to_thread(self.api_client.get_klines, symbol, interval, limit)
             
             # 转换为DataFrame
             df = pd.DataFrame(klines, columns=[
@@ -5,6 +5,7 @@
 """
 
 import asyncio
+import bisect
 import pandas as pd
 import numpy as np
 from abc import ABC, abstractmethod
@@ -17,6 +18,11 @@ from .signal import Signal, SignalType
 from core.indicators import TechnicalIndicators
 
 
+def _signal_time(signal: Signal) -> datetime:
+    """信号历史二分查找使用的排序键"""
+    return signal.timestamp
+
+
 class StrategyState(Enum):
     """策略状态枚举"""
     INACTIVE = "inactive"    # 未激活
@@ -38,6 +44,7 @@ class StrategyMetrics:
         self.sell_signals = 0
         self.strong_signals = 0
         self.avg_strength = 0.0
+        self.total_strength = 0.0  # 信号强度累计值，用于增量计算平均强度
         self.last_signal_time = None
         self.signal_frequency = 0.0  # 信号频率 (每小时)
         
@@ -64,7 +71,14 @@ class StrategyMetrics:
             signal: 新产生的信号
         """
         self.total_signals += 1
-        self.signal_history.append(signal)
+        
+        # 信号历史必须按时间有序（冷却/频率窗口和导出都依赖二分查找）：
+        # 通常新信号时间最晚直接追加，补录的较早信号按时间插入对应位置
+        history = self.signal_history
+        if history and signal.timestamp < history[-1].timestamp:
+            bisect.insort_right(history, signal, key=_signal_time)
+        else:
+            history.append(signal)
         
         # 按信号类型统计
         if signal.signal_type in [SignalType.BUY, SignalType.STRONG_BUY]:
@@ -75,16 +89,17 @@ class StrategyMetrics:
         if signal.is_strong_signal():
             self.strong_signals += 1
         
-        # 更新平均强度
-        total_strength = sum(s.strength for s in self.signal_history)
-        self.avg_strength = total_strength / len(self.signal_history)
+        # 更新平均强度（累计值增量更新，不再每次遍历全部历史）
+        self.total_strength += signal.strength
+        self.avg_strength = self.total_strength / len(self.signal_history)
         
-        self.last_signal_time = signal.timestamp
+        self.last_signal_time = history[-1].timestamp
         
-        # 计算信号频率 (最近24小时)
-        recent_signals = [s for s in self.signal_history 
-                         if (datetime.now() - s.timestamp).total_seconds() < 86400]
-        self.signal_frequency = len(recent_signals) / 24.0
+        # 计算信号频率 (最近24小时)：历史按时间有序，二分定位窗口起点
+        day_start = bisect.bisect_right(
+            self.signal_history, datetime.now() - timedelta(days=1), key=_signal_time
+        )
+        self.signal_frequency = (len(self.signal_history) - day_start) / 24.0
     
     def add_error(self, error_msg: str):
         """记录错误"""
@@ -264,8 +279,9 @@ class BaseStrategy(ABC):
                 self.logger.error(f"❌ {symbol} 缺少列: {missing_columns}")
             return False
         
-        # 检查数据完整性
-        if data[required_columns].isnull().any().any():
+        # 检查数据完整性：转换为连续的float64数组后单遍扫描空值，避免逐列构造布尔Series
+        values = data[required_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isnan(values).any():
             if self.logger:
                 self.logger.warning(f"⚠️ {symbol} 数据包含空值")
             return False
@@ -292,23 +308,26 @@ class BaseStrategy(ABC):
                 self.logger.debug(f"🔽 {symbol} 信号强度不足: {signal.strength}")
             return False
         
+        # 信号历史按时间有序，二分定位时间窗口起点，只检查窗口内的信号
+        history = self.metrics.signal_history
+        now = datetime.now()
+        
         # 检查信号冷却时间
         if self.signal_cooldown > 0:
-            recent_signals = [s for s in self.metrics.signal_history 
-                            if s.symbol == symbol and 
-                            (datetime.now() - s.timestamp).total_seconds() < self.signal_cooldown]
+            cooldown_start = bisect.bisect_right(
+                history, now - timedelta(seconds=self.signal_cooldown), key=_signal_time
+            )
             
-            if recent_signals:
+            if any(history[i].symbol == symbol for i in range(cooldown_start, len(history))):
                 if self.logger:
                     self.logger.debug(f"🔄 {symbol} 信号冷却中")
                 return False
         
         # 检查信号频率限制
         if self.max_signals_per_hour > 0:
-            recent_hour_signals = [s for s in self.metrics.signal_history 
-                                 if (datetime.now() - s.timestamp).total_seconds() < 3600]
+            hour_start = bisect.bisect_right(history, now - timedelta(hours=1), key=_signal_time)
             
-            if len(recent_hour_signals) >= self.max_signals_per_hour:
+            if len(history) - hour_start >= self.max_signals_per_hour:
                 if self.logger:
                     self.logger.warning(f"⚠️ 信号频率过高，跳过 {symbol}")
                 return False
@@ -441,13 +460,11 @@ class BaseStrategy(ABC):
         """
         signals = self.metrics.signal_history
         
-        if start_time:
-            signals = [s for s in signals if s.timestamp >= start_time]
-        
-        if end_time:
-            signals = [s for s in signals if s.timestamp <= end_time]
+        # add_signal 保证历史按时间有序，用二分查找定位区间边界代替全量扫描
+        start_index = bisect.bisect_left(signals, start_time, key=_signal_time) if start_time else 0
+        end_index = bisect.bisect_right(signals, end_time, key=_signal_time) if end_time else len(signals)
         
-        return [signal.to_dict() for signal in signals]
+        return [signal.to_dict() for signal in signals[start_index:end_index]]
     
     def get_performance_report(self) -> Dict[str, Any]:
         """
@@ -38,47 +38,44 @@ def generate_btc_test_data(days: int = 100) -> pd.DataFrame:
     dates = pd.date_range(start='2024-01-01', periods=days, freq='D')
     
     # 模拟BTC价格走势
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     initial_price = 45000
     
     # 生成价格序列 (包含趋势和随机波动)
     trend_component = np.linspace(0, 0.2, days)  # 20%的上升趋势
-    noise = np.random.normal(0, 0.02, days)     # 2%的日波动
+    noise = rng.normal(0, 0.02, days)           # 2%的日波动
     seasonal = 0.05 * np.sin(2 * np.pi * np.arange(days) / 30)  # 月度季节性
     
     returns = trend_component / days + noise + seasonal / days
     
-    # 计算价格
-    prices = [initial_price]
-    for ret in returns[1:]:
-        prices.append(prices[-1] * (1 + ret))
-    
-    # 生成OHLCV数据
-    data = []
-    for i, (date, close) in enumerate(zip(dates, prices)):
-        # 模拟日内波动
-        daily_range = close * 0.03  # 3%的日内波动
-        high = close + np.random.uniform(0, daily_range)
-        low = close - np.random.uniform(0, daily_range)
-        open_price = prices[i-1] if i > 0 else close
-        
-        # 确保OHLC逻辑正确
-        high = max(high, open_price, close)
-        low = min(low, open_price, close)
-        
-        volume = np.random.randint(20000, 100000)  # 随机成交量
-        
-        data.append({
-            'date': date,
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close,
-            'volume': volume
-        })
-    
-    df = pd.DataFrame(data)
-    df.set_index('date', inplace=True)
+    # 计算价格 (累乘代替逐个追加)
+    growth = np.ones(days)
+    growth[1:] = np.cumprod(1 + returns[1:])
+    prices = initial_price * growth
+    
+    # 生成OHLCV数据 (整列计算，不再逐行构造字典)
+    open_prices = np.empty(days)
+    open_prices[0] = prices[0]
+    open_prices[1:] = prices[:-1]
+    
+    # 模拟日内波动
+    daily_range = prices * 0.03  # 3%的日内波动
+    high = prices + rng.uniform(0, daily_range)
+    low = prices - rng.uniform(0, daily_range)
+    
+    # 确保OHLC逻辑正确
+    high = np.maximum.reduce([high, open_prices, prices])
+    low = np.minimum.reduce([low, open_prices, prices])
+    
+    volume = rng.integers(20000, 100000, days)  # 随机成交量
+    
+    df = pd.DataFrame({
+        'open': open_prices,
+        'high': high,
+        'low': low,
+        'close': prices,
+        'volume': volume
+    }, index=pd.Index(dates, name='date'))
     
     print(f"✅ 生成完成 - 价格范围: ${df['close'].min():.0f} - ${df['close'].max():.0f}")
     return df
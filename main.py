@@ -6,6 +6,7 @@ TradeFan 量化交易系统主入口
 
 import asyncio
 import argparse
+import signal
 import sys
 import os
 from pathlib import Path
@@ -214,6 +215,16 @@ async def main():
     # 创建应用程序实例
     app = TradeFanApplication()
     
+    # 通过事件循环注册信号处理：收到SIGINT/SIGTERM时取消主任务，由finally执行优雅关闭
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, main_task.cancel)
+        except NotImplementedError:
+            # Windows不支持add_signal_handler，保留默认的KeyboardInterrupt处理
+            pass
+    
     try:
         # 初始化应用程序
         await app.initialize(config_path=args.config, environment=args.env)
@@ -257,12 +268,19 @@ async def main():
             from monitoring.dashboard.app import start_dashboard
             await start_dashboard(app)
     
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n收到中断信号，正在关闭...")
     except Exception as e:
         print(f"运行错误: {e}")
         sys.exit(1)
     finally:
+        # 关闭期间恢复默认信号处理，再次 Ctrl-C 可强制退出
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.remove_signal_handler(sig)
+            except NotImplementedError:
+                pass
+        
         # 优雅关闭
         await app.shutdown()
 
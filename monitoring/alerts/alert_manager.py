@@ -4,12 +4,14 @@
 """
 
 import asyncio
+import itertools
 import json
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from enum import Enum
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 from core.config_manager import ConfigManager
 from core.logger import LoggerManager
@@ -23,7 +25,7 @@ class AlertLevel(Enum):
     CRITICAL = "critical"   # 严重
 
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """告警对象"""
     id: str                          # 告警ID
@@ -47,7 +49,7 @@ class Alert:
         return result
 
 
-@dataclass 
+@dataclass(slots=True)
 class AlertRule:
     """告警规则"""
     id: str                          # 规则ID
@@ -58,6 +60,10 @@ class AlertRule:
     enabled: bool = True             # 是否启用
     cooldown: int = 300              # 冷却时间（秒）
     last_triggered: Optional[datetime] = None  # 上次触发时间
+    # 上次触发的 (last_triggered, 单调时间)，仅当 last_triggered 未被外部修改时有效
+    _last_fired: Optional[Tuple[datetime, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
 class AlertManager:
@@ -81,7 +87,10 @@ class AlertManager:
         # 告警存储
         self.alerts: Dict[str, Alert] = {}
         self.alert_rules: Dict[str, AlertRule] = {}
-        self.alert_handlers: Dict[AlertLevel, List[Callable]] = {
+        self._alert_seq = itertools.count(1)
+        self._active_count = 0  # 未解决告警数，增量维护
+        # 处理器按 (是否为协程函数, 处理器) 存储，注册时判定一次类型
+        self.alert_handlers: Dict[AlertLevel, List[Tuple[bool, Callable]]] = {
             AlertLevel.INFO: [],
             AlertLevel.WARNING: [],
             AlertLevel.ERROR: [],
@@ -92,6 +101,7 @@ class AlertManager:
         self.max_alerts = config_manager.get('monitoring.alerts.max_alerts', 1000)
         self.alert_retention_days = config_manager.get('monitoring.alerts.retention_days', 30)
         self.notification_enabled = config_manager.get('monitoring.alerts.notifications.enabled', True)
+        self.handler_timeout = config_manager.get('monitoring.alerts.notifications.handler_timeout', 10)
         
         # 统计信息
         self.stats = {
@@ -189,7 +199,7 @@ class AlertManager:
             level: 告警级别
             handler: 处理器函数
         """
-        self.alert_handlers[level].append(handler)
+        self.alert_handlers[level].append((asyncio.iscoroutinefunction(handler), handler))
         self.logger.info(f"为 {level.value} 级别添加告警处理器")
     
     async def trigger_alert(
@@ -220,32 +230,41 @@ class AlertManager:
         if not rule or not rule.enabled:
             return None
         
-        # 检查冷却时间
+        # 检查冷却时间（使用单调时钟，不受系统时间调整影响；
+        # last_triggered 由外部设置时按墙钟时间换算，重置为 None 时视为从未触发）
+        now_mono = time.monotonic()
         if rule.last_triggered:
-            time_since_last = datetime.now() - rule.last_triggered
-            if time_since_last.total_seconds() < rule.cooldown:
+            stamp = rule._last_fired
+            if stamp is not None and stamp[0] is rule.last_triggered:
+                last_fired = stamp[1]
+            else:
+                last_fired = now_mono - (datetime.now() - rule.last_triggered).total_seconds()
+            if now_mono - last_fired < rule.cooldown:
                 return None
         
         # 使用规则级别或指定级别
         alert_level = level or rule.level
         
-        # 创建告警
-        alert_id = f"{rule_id}_{int(datetime.now().timestamp())}"
+        # 创建告警（追加自增序号，避免同一秒内多次触发时ID冲突覆盖）
+        now = datetime.now()
+        alert_id = f"{rule_id}_{int(now.timestamp())}_{next(self._alert_seq)}"
         alert = Alert(
             id=alert_id,
             title=title,
             message=message,
             level=alert_level,
             source=source,
-            timestamp=datetime.now(),
+            timestamp=now,
             data=data or {}
         )
         
         # 存储告警
         self.alerts[alert_id] = alert
+        self._active_count += 1
         
-        # 更新规则触发时间
-        rule.last_triggered = datetime.now()
+        # 更新规则触发时间，同时记录对应的单调时间供冷却判断
+        rule.last_triggered = now
+        rule._last_fired = (now, now_mono)
         
         # 更新统计
         self.stats['total_alerts'] += 1
@@ -298,6 +317,8 @@ class AlertManager:
         """
         if alert_id in self.alerts:
             alert = self.alerts[alert_id]
+            if not alert.resolved:
+                self._active_count -= 1
             alert.resolved = True
             alert.resolution_time = datetime.now()
             alert.data['resolver'] = resolver
@@ -313,39 +334,43 @@ class AlertManager:
         """
         发送告警通知
         
+        全部处理器并发执行：同步处理器通过 asyncio.to_thread 放到线程池中运行，
+        避免阻塞事件循环；每个处理器受 handler_timeout 限制，单个处理器失败或超时
+        不影响其他处理器。超时的同步处理器无法被中断，会在后台线程中继续运行至结束。
+        
         Args:
             alert: 告警对象
         """
         if not self.notification_enabled:
             return
         
-        # 调用注册的处理器
-        handlers = self.alert_handlers.get(alert.level, [])
-        for handler in handlers:
-            try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(alert)
-                else:
-                    handler(alert)
-            except Exception as e:
-                self.logger.error(f"告警处理器执行失败: {e}")
+        calls = []
+        for is_coroutine, handler in self.alert_handlers.get(alert.level, []):
+            call = handler(alert) if is_coroutine else asyncio.to_thread(handler, alert)
+            calls.append(asyncio.wait_for(call, self.handler_timeout))
+        
+        if not calls:
+            return
+        
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for result in results:
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger.error(f"告警处理器执行超时 ({self.handler_timeout}s)")
+            elif isinstance(result, BaseException):
+                # 包括 CancelledError 等非 Exception 异常，同样记录而不是静默丢弃
+                self.logger.error(f"告警处理器执行失败: {type(result).__name__}: {result}")
     
     async def _cleanup_old_alerts(self):
         """清理过期告警"""
         if len(self.alerts) <= self.max_alerts:
             return
         
-        # 按时间排序，删除最旧的告警
-        sorted_alerts = sorted(
-            self.alerts.items(),
-            key=lambda x: x[1].timestamp
-        )
-        
-        # 保留最新的告警
-        alerts_to_keep = dict(sorted_alerts[-self.max_alerts:])
-        removed_count = len(self.alerts) - len(alerts_to_keep)
-        
-        self.alerts = alerts_to_keep
+        # 告警按触发顺序插入字典，从头部依次删除最旧的告警，无需整体排序
+        removed_count = len(self.alerts) - self.max_alerts
+        for _ in range(removed_count):
+            alert = self.alerts.pop(next(iter(self.alerts)))
+            if not alert.resolved:
+                self._active_count -= 1
         
         if removed_count > 0:
             self.logger.info(f"清理了 {removed_count} 个旧告警")
@@ -393,7 +418,7 @@ class AlertManager:
         """
         return {
             **self.stats,
-            'active_alerts': len([a for a in self.alerts.values() if not a.resolved]),
+            'active_alerts': self._active_count,
             'rules_count': len(self.alert_rules),
             'handlers_count': sum(len(handlers) for handlers in self.alert_handlers.values())
         }
@@ -426,19 +451,26 @@ class AlertManager:
     
     async def _background_monitor(self):
         """后台监控任务"""
+        interval = 30
+        next_tick = time.monotonic()
         while self.running:
             try:
                 # 定期清理过期告警
                 await self._cleanup_old_alerts()
                 
-                # 等待30秒
-                await asyncio.sleep(30)
+                # 按截止时间等待，周期不随任务耗时漂移；落后超过一个周期时直接对齐当前时间
+                next_tick += interval
+                now = time.monotonic()
+                if next_tick < now:
+                    next_tick = now
+                await asyncio.sleep(next_tick - now)
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error(f"后台监控任务错误: {e}")
                 await asyncio.sleep(60)  # 出错后等待更长时间
+                next_tick = time.monotonic()
 
 
 def create_alert_manager(config_manager: ConfigManager, logger_manager: LoggerManager) -> AlertManager:
@@ -4,7 +4,9 @@ Web监控面板主应用
 """
 
 import asyncio
+import itertools
 import json
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import logging
@@ -69,9 +71,10 @@ class WebDashboard:
             'positions': {},
             'orders': [],
             'performance': {},
-            'alerts': [],
+            'alerts': deque(maxlen=1000),  # 只保留最近1000条告警
             'system_status': {}
         }
+        self._alert_seq = 0  # 告警自增ID
         
         # 设置路由
         self._setup_routes()
@@ -118,9 +121,11 @@ class WebDashboard:
         @self.app.get("/api/alerts")
         async def get_alerts():
             """获取告警信息"""
+            alerts = self.trading_data['alerts']
             return {
                 "timestamp": datetime.now().isoformat(),
-                "alerts": self.trading_data['alerts'][-100:]  # 最近100条告警
+                # 最近100条告警（只复制末尾部分，不复制整个队列）
+                "alerts": list(itertools.islice(alerts, max(len(alerts) - 100, 0), None))
             }
         
         @self.app.websocket("/ws")
@@ -142,7 +147,7 @@ class WebDashboard:
             # 发送初始数据
             await websocket.send_json({
                 "type": "init",
-                "data": self.trading_data
+                "data": {**self.trading_data, 'alerts': list(self.trading_data['alerts'])}
             })
             
             # 保持连接
@@ -228,7 +233,11 @@ class WebDashboard:
             data: 数据内容
         """
         if data_type in self.trading_data:
-            self.trading_data[data_type] = data
+            if data_type == 'alerts':
+                # 告警保持为定长队列
+                self.trading_data['alerts'] = deque(data, maxlen=self.trading_data['alerts'].maxlen)
+            else:
+                self.trading_data[data_type] = data
             
             # 异步广播更新
             asyncio.create_task(self.broadcast_update(data_type, data))
@@ -242,20 +251,18 @@ class WebDashboard:
             message: 告警消息
             details: 详细信息
         """
+        self._alert_seq += 1
         alert = {
-            'id': len(self.trading_data['alerts']) + 1,
+            'id': self._alert_seq,
             'timestamp': datetime.now().isoformat(),
             'level': level,
             'message': message,
             'details': details or {}
         }
         
+        # 定长队列自动淘汰最早的告警
         self.trading_data['alerts'].append(alert)
         
-        # 只保留最近1000条告警
-        if len(self.trading_data['alerts']) > 1000:
-            self.trading_data['alerts'] = self.trading_data['alerts'][-1000:]
-        
         # 广播告警
         asyncio.create_task(self.broadcast_update('alerts', [alert]))
         
@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 import os
+import threading
 from datetime import datetime, timedelta
 import concurrent.futures
 from itertools import product
@@ -34,6 +35,12 @@ class MultiStrategyEvaluator:
         # 评估结果存储
         self.results = {}
         
+        # 回测数据缓存，多个策略/参数组合共享同一份行情数据
+        self._data_cache: Dict[Tuple, pd.DataFrame] = {}
+        # 并行回测时每个缓存键一把锁，保证同一份数据只加载一次
+        self._data_cache_lock = threading.Lock()
+        self._data_cache_key_locks: Dict[Tuple, threading.Lock] = {}
+        
     def run_multi_backtest(self, 
                           strategies: List[str], 
                           symbols: List[str], 
@@ -170,7 +177,22 @@ class MultiStrategyEvaluator:
     
     def _get_backtest_data(self, symbol: str, timeframe: str, 
                           start_date: str, end_date: str) -> pd.DataFrame:
-        """获取回测数据"""
+        """获取回测数据（相同交易对/周期/区间只加载一次，返回副本避免策略间互相修改）"""
+        cache_key = (symbol, timeframe, start_date, end_date)
+        with self._data_cache_lock:
+            key_lock = self._data_cache_key_locks.setdefault(cache_key, threading.Lock())
+        
+        # 同一键的其他线程在此等待首个线程加载完成，不同键之间互不阻塞
+        with key_lock:
+            data = self._data_cache.get(cache_key)
+            if data is None:
+                data = self._load_backtest_data(symbol, timeframe, start_date, end_date)
+                self._data_cache[cache_key] = data
+        return data.copy()
+    
+    def _load_backtest_data(self, symbol: str, timeframe: str, 
+                           start_date: str, end_date: str) -> pd.DataFrame:
+        """从数据模块加载回测数据，失败时使用模拟数据"""
         try:
             # 尝试从数据模块获取数据
             data = self.data_module.get_historical_data(
@@ -189,7 +211,8 @@ class MultiStrategyEvaluator:
     
     def _generate_sample_data(self, symbol: str, periods: int) -> pd.DataFrame:
         """生成模拟数据"""
-        np.random.seed(42)
+        # 每次调用使用独立的随机数生成器，结果可复现且在并行回测线程中互不干扰
+        rng = np.random.default_rng(42)
         
         # 根据币种设置基础价格
         base_prices = {
@@ -202,29 +225,29 @@ class MultiStrategyEvaluator:
         base_price = base_prices.get(symbol, 1000)
         
         # 生成价格序列
-        returns = np.random.normal(0.0001, 0.02, periods)  # 日收益率
+        returns = 0.0001 + rng.standard_normal(periods) * 0.02  # 日收益率
         prices = base_price * np.exp(np.cumsum(returns))
         
-        # 生成OHLCV数据
-        data = []
-        for i, price in enumerate(prices):
-            high = price * (1 + abs(np.random.normal(0, 0.01)))
-            low = price * (1 - abs(np.random.normal(0, 0.01)))
-            open_price = prices[i-1] if i > 0 else price
-            volume = np.random.randint(1000, 10000)
-            
-            data.append({
-                'timestamp': pd.Timestamp.now() - pd.Timedelta(hours=periods-i),
-                'open': open_price,
-                'high': high,
-                'low': low,
-                'close': price,
-                'volume': volume
-            })
-        
-        df = pd.DataFrame(data)
-        df.set_index('timestamp', inplace=True)
-        return df
+        # 一次性生成全部OHLCV列，避免逐行调用随机数和构造字典
+        open_prices = np.empty(periods)
+        open_prices[0] = prices[0]
+        open_prices[1:] = prices[:-1]  # 开盘价为上一根K线收盘价
+        high_noise = np.abs(rng.standard_normal(periods)) * 0.01
+        low_noise = np.abs(rng.standard_normal(periods)) * 0.01
+        high = np.maximum.reduce([open_prices, prices * (1 + high_noise), prices])
+        low = np.minimum.reduce([open_prices, prices * (1 - low_noise), prices])
+        volume = rng.integers(1000, 10000, periods)
+        
+        # 按小时倒推时间戳，最后一根K线距当前1小时
+        timestamps = pd.Timestamp.now() - pd.to_timedelta(np.arange(periods, 0, -1), unit='h')
+        
+        return pd.DataFrame({
+            'open': open_prices,
+            'high': high,
+            'low': low,
+            'close': prices,
+            'volume': volume
+        }, index=pd.DatetimeIndex(timestamps, name='timestamp'))
     
     def _get_strategy_config(self, strategy_name: str, symbol: str) -> Dict:
         """获取策略配置"""
@@ -246,25 +269,30 @@ class MultiStrategyEvaluator:
         position = 0
         entry_price = 0
         trades = []
-        equity_curve = []
         
         commission = 0.001  # 0.1% 手续费
-        
-        for i, row in signals.iterrows():
-            current_price = row['close']
-            signal = row['signal']
+        buy_cost_factor = 1 + commission  # 买入成本系数，循环外预先计算
+        sell_value_factor = 1 - commission  # 卖出净值系数
+        
+        # 按列取出连续数组，权益曲线写入预分配数组（代替逐行构造字典）
+        timestamps = signals.index
+        close_prices = signals['close'].to_numpy(dtype=np.float64)
+        signal_values = signals['signal'].to_numpy()
+        equity_values = np.empty(len(signals))
+        position_values = np.empty(len(signals))
+        
+        for k in range(len(signals)):
+            i = timestamps[k]
+            current_price = close_prices[k]
+            signal = signal_values[k]
             
             # 计算当前权益
             current_equity = capital
             if position > 0:
                 current_equity += position * current_price
             
-            equity_curve.append({
-                'timestamp': i,
-                'equity': current_equity,
-                'position': position,
-                'price': current_price
-            })
+            equity_values[k] = current_equity
+            position_values[k] = position
             
             # 处理交易信号
             if signal == 1 and position == 0:  # 买入
@@ -272,7 +300,7 @@ class MultiStrategyEvaluator:
                 buy_amount = capital * 0.95 / current_price
                 position = buy_amount
                 entry_price = current_price
-                cost = position * current_price * (1 + commission)
+                cost = position * current_price * buy_cost_factor
                 capital -= cost
                 
                 trades.append({
@@ -285,7 +313,7 @@ class MultiStrategyEvaluator:
                 
             elif signal == -1 and position > 0:  # 卖出
                 # 卖出所有持仓
-                sell_value = position * current_price * (1 - commission)
+                sell_value = position * current_price * sell_value_factor
                 pnl = sell_value - (position * entry_price)
                 pnl_pct = pnl / (position * entry_price)
                 
@@ -307,7 +335,14 @@ class MultiStrategyEvaluator:
         # 计算最终权益
         final_equity = capital
         if position > 0:
-            final_equity += position * signals.iloc[-1]['close']
+            final_equity += position * close_prices[-1]
+        
+        equity_curve = pd.DataFrame({
+            'timestamp': timestamps,
+            'equity': equity_values,
+            'position': position_values,
+            'price': close_prices
+        })
         
         # 计算性能指标
         metrics = self._calculate_performance_metrics(
@@ -321,42 +356,43 @@ class MultiStrategyEvaluator:
             'final_equity': final_equity,
             'signals': signals,
             'trades': trades,
-            'equity_curve': pd.DataFrame(equity_curve),
+            'equity_curve': equity_curve,
             **metrics
         }
     
-    def _calculate_performance_metrics(self, equity_curve: List, trades: List,
+    def _calculate_performance_metrics(self, equity_curve: pd.DataFrame, trades: List,
                                      initial_capital: float, final_equity: float) -> Dict:
         """计算性能指标"""
-        if not equity_curve:
+        if equity_curve.empty:
             return {}
         
-        equity_df = pd.DataFrame(equity_curve)
+        equity_df = equity_curve
         
         # 基础指标
         total_return = (final_equity - initial_capital) / initial_capital
         
-        # 交易统计
-        sell_trades = [t for t in trades if t.get('type') == 'sell']
-        total_trades = len(sell_trades)
+        # 交易统计（卖出交易盈亏转成数组后统一做向量化统计）
+        pnl = np.array([t.get('pnl', 0) for t in trades if t.get('type') == 'sell'], dtype=np.float64)
+        total_trades = len(pnl)
         
         if total_trades > 0:
-            winning_trades = len([t for t in sell_trades if t.get('pnl', 0) > 0])
+            wins = pnl[pnl > 0]
+            losses = pnl[pnl < 0]
+            winning_trades = len(wins)
             win_rate = winning_trades / total_trades
             
-            pnl_list = [t.get('pnl', 0) for t in sell_trades]
-            avg_win = np.mean([p for p in pnl_list if p > 0]) if winning_trades > 0 else 0
-            avg_loss = np.mean([p for p in pnl_list if p < 0]) if (total_trades - winning_trades) > 0 else 0
+            avg_win = wins.mean() if winning_trades > 0 else 0
+            avg_loss = losses.mean() if len(losses) > 0 else 0
             profit_factor = abs(avg_win / avg_loss) if avg_loss != 0 else 0
         else:
             winning_trades = 0
             win_rate = 0
             profit_factor = 0
         
-        # 最大回撤
-        peak = equity_df['equity'].expanding().max()
-        drawdown = (equity_df['equity'] - peak) / peak
-        max_drawdown = abs(drawdown.min()) if not drawdown.empty else 0
+        # 最大回撤（累计最大值一次扫描得到净值峰值）
+        equity = equity_df['equity'].to_numpy(dtype=np.float64)
+        peak = np.maximum.accumulate(equity)
+        max_drawdown = abs(((equity - peak) / peak).min())
         
         # 夏普比率 (简化计算)
         if len(equity_df) > 1:
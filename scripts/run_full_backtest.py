@@ -6,11 +6,14 @@
 
 import sys
 import os
+import argparse
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from typing import Optional
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -20,6 +23,135 @@ from strategies.scalping_strategy import ScalpingStrategy
 from modules.risk_module import RiskModule
 from modules.log_module import LogModule
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """numba 未安装时的空装饰器，回退为普通 Python 函数"""
+        def decorator(func):
+            return func
+        return decorator
+
+# 平仓原因编码 (状态机内部使用整数，输出时再转换为文字)
+CLOSE_REASONS = {1: "止损", 2: "止盈", 3: "反向信号", 4: "超时"}
+
+
+@njit(cache=True)
+def _run_backtest_loop(close, atr, times_ns, incomplete, signals,
+                       start_idx, max_hold, initial_capital):
+    """
+    逐K线执行开平仓状态机 (numba 可用时编译为机器码)
+    
+    Args:
+        close: 收盘价数组
+        atr: ATR数组
+        times_ns: 时间戳数组 (纳秒)
+        incomplete: 指标不完整标记数组
+        signals: 信号数组 (1 多头, -1 空头, 0 无信号)
+        start_idx: 起始K线索引
+        max_hold: 最大持仓小时数
+        initial_capital: 初始资金
+        
+    Returns:
+        权益曲线、各笔交易的开/平仓索引、方向、收益率、盈亏金额、平仓原因编码，
+        以及回测结束时未平仓持仓的开仓索引 (无持仓为 -1)
+    """
+    n = len(close)
+    capacity = max(n - start_idx, 0)
+    
+    equity = np.empty(capacity + 1)
+    equity[0] = initial_capital
+    entry_idx = np.empty(capacity, dtype=np.int64)
+    exit_idx = np.empty(capacity, dtype=np.int64)
+    positions = np.empty(capacity, dtype=np.int8)
+    pnl_pcts = np.empty(capacity)
+    pnl_amounts = np.empty(capacity)
+    reason_codes = np.empty(capacity, dtype=np.int8)
+    
+    capital = initial_capital
+    position = 0  # 0: 无仓位, 1: 多头, -1: 空头
+    entry = -1
+    entry_price = 0.0
+    stop_loss = 0.0
+    take_profit = 0.0
+    n_trades = 0
+    
+    for i in range(start_idx, n):
+        # 跳过指标不完整的数据
+        if incomplete[i]:
+            equity[i - start_idx + 1] = equity[i - start_idx]
+            continue
+        
+        signal = signals[i]
+        current_price = close[i]
+        
+        # 处理开仓信号
+        if position == 0 and signal != 0:
+            position = signal
+            entry = i
+            entry_price = current_price
+            
+            # 设置止损止盈
+            if signal == 1:  # 多头
+                stop_loss = entry_price - (atr[i] * 2)
+                take_profit = entry_price + (atr[i] * 4)  # 2:1盈亏比
+            else:  # 空头
+                stop_loss = entry_price + (atr[i] * 2)
+                take_profit = entry_price - (atr[i] * 4)
+        
+        # 处理平仓条件
+        elif position != 0:
+            reason = 0
+            
+            # 止损止盈检查
+            if position == 1:  # 多头
+                if current_price <= stop_loss:
+                    reason = 1
+                elif current_price >= take_profit:
+                    reason = 2
+            else:  # 空头
+                if current_price >= stop_loss:
+                    reason = 1
+                elif current_price <= take_profit:
+                    reason = 2
+            
+            # 反向信号
+            if signal != 0 and signal != position:
+                reason = 3
+            
+            if (times_ns[i] - times_ns[entry]) / 1e9 / 3600 > max_hold:
+                reason = 4
+            
+            # 执行平仓
+            if reason != 0:
+                if position == 1:
+                    pnl_pct = (current_price - entry_price) / entry_price
+                else:
+                    pnl_pct = (entry_price - current_price) / entry_price
+                
+                pnl_amount = capital * 0.01 * pnl_pct * 100  # 1%仓位
+                capital += pnl_amount
+                
+                entry_idx[n_trades] = entry
+                exit_idx[n_trades] = i
+                positions[n_trades] = position
+                pnl_pcts[n_trades] = pnl_pct
+                pnl_amounts[n_trades] = pnl_amount
+                reason_codes[n_trades] = reason
+                n_trades += 1
+                
+                # 重置仓位
+                position = 0
+                entry = -1
+                entry_price = 0.0
+        
+        # 更新权益曲线
+        equity[i - start_idx + 1] = capital
+    
+    return (equity, entry_idx[:n_trades], exit_idx[:n_trades], positions[:n_trades],
+            pnl_pcts[:n_trades], pnl_amounts[:n_trades], reason_codes[:n_trades], entry)
+
+
 class FullBacktester:
     """完整数据回测器"""
     
@@ -120,164 +252,101 @@ class FullBacktester:
     def _execute_backtest(self, data: pd.DataFrame, strategy, symbol: str, timeframe: str) -> dict:
         """执行回测逻辑"""
         
-        # 初始化变量
-        capital = self.config['initial_capital']
-        position = 0  # 0: 无仓位, 1: 多头, -1: 空头
-        entry_price = 0
-        entry_time = None
-        stop_loss = 0
-        take_profit = 0
-        
+        # 一次性计算全部信号，并按列取出连续数组交给逐K线状态机
+        signals = self._generate_signals(data).astype(np.int8)
+        close_prices = data['close'].to_numpy(dtype=np.float64)
+        atr_values = data['atr'].to_numpy(dtype=np.float64)
+        times = data['datetime'].tolist()
+        times_ns = data['datetime'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+        incomplete = (data['ema_55'].isna() | data['rsi'].isna() | data['atr'].isna()).to_numpy()
+        
+        # 最大持仓时间 (根据时间框架调整)
+        max_hold_hours = {'1h': 24, '4h': 96, '1d': 240}
+        max_hold = max_hold_hours.get(timeframe, 240)
+        
+        # 从55开始，确保指标计算完整
+        (equity, entry_idx, exit_idx, positions, pnl_pcts,
+         pnl_amounts, reason_codes, open_entry) = _run_backtest_loop(
+            close_prices, atr_values, times_ns, incomplete, signals,
+            55, float(max_hold), float(self.config['initial_capital'])
+        )
+        
+        # 根据状态机输出还原交易记录
         trades = []
-        equity = [capital]
-        
-        # 遍历数据
-        for i in range(55, len(data)):  # 从55开始，确保指标计算完整
-            current = data.iloc[i]
+        for k in range(len(entry_idx)):
+            entry, exit_ = entry_idx[k], exit_idx[k]
+            position = int(positions[k])
+            entry_price = close_prices[entry]
+            exit_price = close_prices[exit_]
+            close_reason = CLOSE_REASONS[reason_codes[k]]
             
-            # 跳过指标不完整的数据
-            if pd.isna(current['ema_55']) or pd.isna(current['rsi']) or pd.isna(current['atr']):
-                equity.append(equity[-1])
-                continue
+            print(f"   📈 开仓: {position} @ {entry_price:.2f} ({times[entry]})")
             
-            # 生成交易信号
-            signal = self._generate_signal(data.iloc[i-10:i+1])  # 使用最近10条数据
-            
-            current_time = current['datetime']
-            current_price = current['close']
-            
-            # 处理开仓信号
-            if position == 0 and signal != 0:
-                position = signal
-                entry_price = current_price
-                entry_time = current_time
-                
-                # 设置止损止盈
-                atr_value = current['atr']
-                if signal == 1:  # 多头
-                    stop_loss = entry_price - (atr_value * 2)
-                    take_profit = entry_price + (atr_value * 4)  # 2:1盈亏比
-                else:  # 空头
-                    stop_loss = entry_price + (atr_value * 2)
-                    take_profit = entry_price - (atr_value * 4)
-                
-                print(f"   📈 开仓: {signal} @ {entry_price:.2f} ({current_time})")
-            
-            # 处理平仓条件
-            elif position != 0:
-                should_close = False
-                close_reason = ""
-                
-                # 止损止盈检查
-                if position == 1:  # 多头
-                    if current_price <= stop_loss:
-                        should_close = True
-                        close_reason = "止损"
-                    elif current_price >= take_profit:
-                        should_close = True
-                        close_reason = "止盈"
-                else:  # 空头
-                    if current_price >= stop_loss:
-                        should_close = True
-                        close_reason = "止损"
-                    elif current_price <= take_profit:
-                        should_close = True
-                        close_reason = "止盈"
-                
-                # 反向信号
-                if signal != 0 and signal != position:
-                    should_close = True
-                    close_reason = "反向信号"
-                
-                # 最大持仓时间 (根据时间框架调整)
-                max_hold_hours = {'1h': 24, '4h': 96, '1d': 240}
-                max_hold = max_hold_hours.get(timeframe, 240)
-                
-                if (current_time - entry_time).total_seconds() / 3600 > max_hold:
-                    should_close = True
-                    close_reason = "超时"
-                
-                # 执行平仓
-                if should_close:
-                    # 计算盈亏
-                    if position == 1:
-                        pnl_pct = (current_price - entry_price) / entry_price
-                    else:
-                        pnl_pct = (entry_price - current_price) / entry_price
-                    
-                    pnl_amount = capital * 0.01 * pnl_pct * 100  # 1%仓位
-                    capital += pnl_amount
-                    
-                    # 记录交易
-                    trade = {
-                        'symbol': symbol,
-                        'timeframe': timeframe,
-                        'entry_time': entry_time,
-                        'exit_time': current_time,
-                        'entry_price': entry_price,
-                        'exit_price': current_price,
-                        'position': position,
-                        'pnl_pct': pnl_pct * 100,
-                        'pnl_amount': pnl_amount,
-                        'reason': close_reason,
-                        'duration_hours': (current_time - entry_time).total_seconds() / 3600
-                    }
-                    trades.append(trade)
-                    
-                    print(f"   📉 平仓: {position} @ {current_price:.2f} | 盈亏: {pnl_pct*100:.2f}% | {close_reason}")
-                    
-                    # 重置仓位
-                    position = 0
-                    entry_price = 0
-                    entry_time = None
+            trade = {
+                'symbol': symbol,
+                'timeframe': timeframe,
+                'entry_time': times[entry],
+                'exit_time': times[exit_],
+                'entry_price': entry_price,
+                'exit_price': exit_price,
+                'position': position,
+                'pnl_pct': pnl_pcts[k] * 100,
+                'pnl_amount': pnl_amounts[k],
+                'reason': close_reason,
+                'duration_hours': (times[exit_] - times[entry]).total_seconds() / 3600
+            }
+            trades.append(trade)
             
-            # 更新权益曲线
-            equity.append(capital)
+            print(f"   📉 平仓: {position} @ {exit_price:.2f} | 盈亏: {pnl_pcts[k]*100:.2f}% | {close_reason}")
+        
+        # 回测结束时仍未平仓的持仓
+        if open_entry >= 0:
+            print(f"   📈 开仓: {int(signals[open_entry])} @ {close_prices[open_entry]:.2f} ({times[open_entry]})")
         
         # 计算回测结果
-        results = self._calculate_results(trades, equity, symbol, timeframe)
+        results = self._calculate_results(trades, equity.tolist(), symbol, timeframe)
         
         return results
     
-    def _generate_signal(self, data: pd.DataFrame) -> int:
-        """生成交易信号"""
-        if len(data) < 2:
-            return 0
-        
-        current = data.iloc[-1]
-        prev = data.iloc[-2]
+    def _generate_signals(self, data: pd.DataFrame) -> np.ndarray:
+        """生成交易信号 (向量化计算每根K线的信号: 1 多头, -1 空头, 0 无信号)"""
+        close = data['close'].to_numpy(dtype=np.float64)
+        prev_close = np.empty_like(close)
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+        
+        ema_8 = data['ema_8'].to_numpy(dtype=np.float64)
+        ema_21 = data['ema_21'].to_numpy(dtype=np.float64)
+        ema_55 = data['ema_55'].to_numpy(dtype=np.float64)
+        bb_middle = data['bb_middle'].to_numpy(dtype=np.float64)
+        rsi = data['rsi'].to_numpy(dtype=np.float64)
+        macd = data['macd'].to_numpy(dtype=np.float64)
+        macd_signal = data['macd_signal'].to_numpy(dtype=np.float64)
+        
+        rsi_in_range = (rsi > 30) & (rsi < 70)  # RSI在合理区间
         
         # 多头信号条件
-        long_conditions = [
-            current['ema_8'] > current['ema_21'],  # 短期EMA > 中期EMA
-            current['ema_21'] > current['ema_55'],  # 中期EMA > 长期EMA
-            current['close'] > current['bb_middle'],  # 价格在布林带中轨上方
-            current['rsi'] > 30 and current['rsi'] < 70,  # RSI在合理区间
-            current['macd'] > current['macd_signal'],  # MACD金叉
-            current['close'] > prev['close']  # 价格上涨
-        ]
+        long_score = (
+            (ema_8 > ema_21).astype(np.int8)  # 短期EMA > 中期EMA
+            + (ema_21 > ema_55)  # 中期EMA > 长期EMA
+            + (close > bb_middle)  # 价格在布林带中轨上方
+            + rsi_in_range
+            + (macd > macd_signal)  # MACD金叉
+            + (close > prev_close)  # 价格上涨
+        )
         
         # 空头信号条件
-        short_conditions = [
-            current['ema_8'] < current['ema_21'],  # 短期EMA < 中期EMA
-            current['ema_21'] < current['ema_55'],  # 中期EMA < 长期EMA
-            current['close'] < current['bb_middle'],  # 价格在布林带中轨下方
-            current['rsi'] > 30 and current['rsi'] < 70,  # RSI在合理区间
-            current['macd'] < current['macd_signal'],  # MACD死叉
-            current['close'] < prev['close']  # 价格下跌
-        ]
-        
-        # 信号强度计算
-        long_score = sum(long_conditions)
-        short_score = sum(short_conditions)
+        short_score = (
+            (ema_8 < ema_21).astype(np.int8)  # 短期EMA < 中期EMA
+            + (ema_21 < ema_55)  # 中期EMA < 长期EMA
+            + (close < bb_middle)  # 价格在布林带中轨下方
+            + rsi_in_range
+            + (macd < macd_signal)  # MACD死叉
+            + (close < prev_close)  # 价格下跌
+        )
         
         # 需要至少4个条件满足才开仓
-        if long_score >= 4:
-            return 1  # 多头信号
-        elif short_score >= 4:
-            return -1  # 空头信号
-        else:
-            return 0  # 无信号
+        return np.where(long_score >= 4, 1, np.where(short_score >= 4, -1, 0))
     
     def _calculate_results(self, trades: list, equity: list, symbol: str, timeframe: str) -> dict:
         """计算回测结果"""
@@ -340,16 +409,43 @@ class FullBacktester:
         
         return results
     
-    def run_comprehensive_backtest(self):
-        """运行综合回测"""
+    def run_comprehensive_backtest(self, parallel: bool = False, max_workers: Optional[int] = None):
+        """
+        运行综合回测
+        
+        Args:
+            parallel: 是否使用多进程并行执行 (各交易对/时间框架相互独立且为CPU密集型)，默认串行
+            max_workers: 最大进程数，默认使用CPU核心数
+        """
         print("🚀 开始综合回测...")
         print("=" * 60)
         
-        all_results = []
-        
         # 测试不同交易对和时间框架
-        for symbol in self.config['symbols']:
-            for timeframe in self.config['timeframes']:
+        configs = [(symbol, timeframe)
+                   for symbol in self.config['symbols']
+                   for timeframe in self.config['timeframes']]
+        
+        if parallel and len(configs) > 1:
+            results_by_config = {}
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                future_to_config = {
+                    executor.submit(_run_backtest_task, self.config, symbol, timeframe): (symbol, timeframe)
+                    for symbol, timeframe in configs
+                }
+                
+                for future in as_completed(future_to_config):
+                    symbol, timeframe = future_to_config[future]
+                    try:
+                        results_by_config[(symbol, timeframe)] = future.result()
+                    except Exception as e:
+                        print(f"❌ 回测异常 {symbol} ({timeframe}): {str(e)}")
+            
+            # 按配置顺序汇总，保证报告顺序与串行执行一致
+            all_results = [results_by_config[config] for config in configs
+                           if results_by_config.get(config)]
+        else:
+            all_results = []
+            for symbol, timeframe in configs:
                 result = self.run_backtest(symbol, timeframe)
                 if result:
                     all_results.append(result)
@@ -484,8 +580,29 @@ class FullBacktester:
             print(f"⚠️  图表生成失败: {str(e)}")
 
 
+# 子进程内复用的回测器实例
+_worker_backtester = None
+
+
+def _run_backtest_task(config: dict, symbol: str, timeframe: str):
+    """子进程回测任务 (模块级函数以便 ProcessPoolExecutor 序列化)"""
+    global _worker_backtester
+    if _worker_backtester is None:
+        _worker_backtester = FullBacktester()
+    _worker_backtester.config = config
+    return _worker_backtester.run_backtest(symbol, timeframe)
+
+
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description='TradeFan 完整数据回测')
+    parser.add_argument('--parallel', '-p', action='store_true',
+                       help='使用多进程并行回测各交易对/时间框架')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                       help='并行回测的最大进程数 (默认: CPU核心数)')
+    
+    args = parser.parse_args()
+    
     print("🚀 TradeFan 完整数据回测系统")
     print("=" * 50)
     
@@ -505,7 +622,8 @@ def main():
     
     # 运行回测
     backtester = FullBacktester()
-    results = backtester.run_comprehensive_backtest()
+    results = backtester.run_comprehensive_backtest(parallel=args.parallel,
+                                                    max_workers=args.workers)
     
     print(f"\n🎉 回测完成! 共测试了 {len(results)} 个配置")
 
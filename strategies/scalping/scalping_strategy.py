@@ -198,6 +198,11 @@ class ScalpingStrategy(BaseStrategy):
         mean_reversion_signals = self._get_mean_reversion_signals(df)
         volume_signals = self._get_volume_signals(df)
         
+        # 信号结果先写入预分配数组，循环结束后一次性赋值，避免逐行按标签写入DataFrame
+        signal_values = np.zeros(len(df), dtype=np.int64)
+        strength_values = np.zeros(len(df))
+        entry_reasons = [''] * len(df)
+        
         # 综合信号
         for i in range(len(df)):
             if i < max(self.params['ema_slow'], self.params['bb_period']):
@@ -222,13 +227,17 @@ class ScalpingStrategy(BaseStrategy):
             # 应用过滤器
             if self._apply_filters(df, i, long_score, short_score):
                 if long_score > 0.6:  # 强多头信号
-                    df.loc[df.index[i], 'signal'] = 1
-                    df.loc[df.index[i], 'signal_strength'] = long_score
-                    df.loc[df.index[i], 'entry_reason'] = self._get_entry_reason(df, i, 'long')
+                    signal_values[i] = 1
+                    strength_values[i] = long_score
+                    entry_reasons[i] = self._get_entry_reason(df, i, 'long')
                 elif short_score > 0.6:  # 强空头信号
-                    df.loc[df.index[i], 'signal'] = -1
-                    df.loc[df.index[i], 'signal_strength'] = short_score
-                    df.loc[df.index[i], 'entry_reason'] = self._get_entry_reason(df, i, 'short')
+                    signal_values[i] = -1
+                    strength_values[i] = short_score
+                    entry_reasons[i] = self._get_entry_reason(df, i, 'short')
+        
+        df['signal'] = signal_values
+        df['signal_strength'] = strength_values
+        df['entry_reason'] = entry_reasons
         
         # 计算动态止损止盈
         df = self._calculate_dynamic_stops(df)
@@ -452,23 +461,16 @@ class ScalpingStrategy(BaseStrategy):
     
     def _calculate_dynamic_stops(self, df: pd.DataFrame) -> pd.DataFrame:
         """计算动态止损止盈"""
-        df['dynamic_stop_loss'] = 0.0
-        df['dynamic_take_profit'] = 0.0
-        
-        for i in range(len(df)):
-            if df['signal'].iloc[i] != 0:
-                atr_value = df['atr'].iloc[i]
-                current_price = df['close'].iloc[i]
-                
-                if df['signal'].iloc[i] == 1:  # 多头
-                    stop_loss = current_price - (atr_value * self.params['atr_multiplier'])
-                    take_profit = current_price + (atr_value * self.params['atr_multiplier'] * self.params['profit_target_ratio'])
-                else:  # 空头
-                    stop_loss = current_price + (atr_value * self.params['atr_multiplier'])
-                    take_profit = current_price - (atr_value * self.params['atr_multiplier'] * self.params['profit_target_ratio'])
-                
-                df.loc[df.index[i], 'dynamic_stop_loss'] = stop_loss
-                df.loc[df.index[i], 'dynamic_take_profit'] = take_profit
+        signal = df['signal'].to_numpy()
+        stop_distance = df['atr'].to_numpy() * self.params['atr_multiplier']
+        profit_distance = stop_distance * self.params['profit_target_ratio']
+        current_price = df['close'].to_numpy()
+        
+        # 多头: 止损在下方、止盈在上方；空头相反；无信号为0
+        direction = np.where(signal == 1, 1.0, -1.0)
+        has_signal = signal != 0
+        df['dynamic_stop_loss'] = np.where(has_signal, current_price - direction * stop_distance, 0.0)
+        df['dynamic_take_profit'] = np.where(has_signal, current_price + direction * profit_distance, 0.0)
         
         return df
     
@@ -0,0 +1,207 @@
+"""
+告警管理器测试
+验证告警通知分发、超时处理与告警数量统计
+"""
+
+import sys
+import os
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta
+
+# 添加项目路径；告警模块目录单独加入路径，直接导入 alert_manager，
+# 避免 monitoring 包初始化时加载仪表板依赖
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+sys.path.append(os.path.join(PROJECT_ROOT, 'monitoring', 'alerts'))
+
+from alert_manager import AlertManager, AlertRule, AlertLevel
+
+
+class _Config:
+    """测试用配置管理器"""
+    
+    def __init__(self, values=None):
+        self.values = values or {}
+    
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class _LoggerManager:
+    """测试用日志管理器"""
+    
+    def get_logger(self, name):
+        return logging.getLogger(name)
+
+
+def _create_manager(values=None) -> AlertManager:
+    manager = AlertManager(_Config(values), _LoggerManager())
+    manager.add_rule(AlertRule(
+        id="test_rule",
+        name="测试规则",
+        condition="test",
+        level=AlertLevel.WARNING,
+        message_template="测试告警",
+        cooldown=0
+    ))
+    return manager
+
+
+def test_slow_async_handler_times_out():
+    """慢协程处理器超时后，其他处理器仍正常执行且不阻塞告警"""
+    manager = _create_manager({'monitoring.alerts.notifications.handler_timeout': 0.05})
+    calls = []
+    
+    async def slow_handler(alert):
+        await asyncio.sleep(5)
+        calls.append('slow')
+    
+    async def fast_handler(alert):
+        calls.append('async')
+    
+    manager.add_handler(AlertLevel.WARNING, slow_handler)
+    manager.add_handler(AlertLevel.WARNING, fast_handler)
+    manager.add_handler(AlertLevel.WARNING, lambda alert: calls.append('sync'))
+    
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        alert = await manager.trigger_alert("test_rule", "标题", "消息")
+        return alert, loop.time() - start
+    
+    alert, elapsed = asyncio.run(run())
+    
+    assert alert is not None
+    assert sorted(calls) == ['async', 'sync']
+    assert elapsed < 1
+
+
+def test_blocking_sync_handler_does_not_block_loop():
+    """阻塞的同步处理器在线程中运行并受超时限制，不阻塞事件循环"""
+    manager = _create_manager({'monitoring.alerts.notifications.handler_timeout': 0.05})
+    release = threading.Event()
+    calls = []
+    
+    def blocking_handler(alert):
+        release.wait(5)
+        calls.append('blocking')
+    
+    async def fast_handler(alert):
+        calls.append('async')
+    
+    manager.add_handler(AlertLevel.WARNING, blocking_handler)
+    manager.add_handler(AlertLevel.WARNING, fast_handler)
+    
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        alert = await manager.trigger_alert("test_rule", "标题", "消息")
+        elapsed = loop.time() - start
+        release.set()
+        return alert, elapsed
+    
+    alert, elapsed = asyncio.run(run())
+    
+    assert alert is not None
+    assert calls[0] == 'async'
+    assert elapsed < 1
+
+
+def test_cancelled_handler_is_logged():
+    """处理器抛出 CancelledError 等非 Exception 异常时记录错误日志"""
+    manager = _create_manager()
+    records = []
+    
+    class _Collector(logging.Handler):
+        def emit(self, record):
+            records.append(record.getMessage())
+    
+    collector = _Collector()
+    manager.logger.addHandler(collector)
+    
+    async def cancelled_handler(alert):
+        raise asyncio.CancelledError()
+    
+    manager.add_handler(AlertLevel.WARNING, cancelled_handler)
+    
+    try:
+        alert = asyncio.run(manager.trigger_alert("test_rule", "标题", "消息"))
+    finally:
+        manager.logger.removeHandler(collector)
+    
+    assert alert is not None
+    assert any('CancelledError' in message for message in records)
+
+
+def test_rule_cooldown():
+    """冷却时间对已触发规则、预设 last_triggered 的规则及同ID替换的规则均生效"""
+    manager = _create_manager()
+    
+    def make_rule(last_triggered=None):
+        return AlertRule(
+            id="cooldown_rule",
+            name="冷却规则",
+            condition="test",
+            level=AlertLevel.INFO,
+            message_template="测试告警",
+            cooldown=300,
+            last_triggered=last_triggered
+        )
+    
+    async def fire():
+        return await manager.trigger_alert("cooldown_rule", "标题", "消息")
+    
+    async def run():
+        # 新增时已带有近期触发时间：处于冷却中
+        manager.add_rule(make_rule(datetime.now() - timedelta(seconds=10)))
+        assert await fire() is None
+        
+        # 触发时间早于冷却时间：可以触发，随后进入冷却
+        manager.add_rule(make_rule(datetime.now() - timedelta(seconds=600)))
+        assert await fire() is not None
+        assert await fire() is None
+        
+        # 同ID替换并沿用原触发时间：冷却不被重置
+        old_rule = manager.alert_rules["cooldown_rule"]
+        manager.add_rule(make_rule(old_rule.last_triggered))
+        assert await fire() is None
+        
+        # 重置 last_triggered 视为从未触发
+        manager.alert_rules["cooldown_rule"].last_triggered = None
+        assert await fire() is not None
+    
+    asyncio.run(run())
+
+
+def test_active_count_after_eviction():
+    """超出 max_alerts 淘汰旧告警后，未解决告警计数与实际一致"""
+    manager = _create_manager({'monitoring.alerts.max_alerts': 5})
+    
+    async def run():
+        alert_ids = []
+        for i in range(12):
+            alert = await manager.trigger_alert("test_rule", f"告警{i}", "消息")
+            alert_ids.append(alert.id)
+            # 已解决与未解决交替出现，重复解决不应重复计数
+            if i % 3 == 0:
+                await manager.resolve_alert(alert.id)
+                await manager.resolve_alert(alert.id)
+            assert manager._active_count == sum(not a.resolved for a in manager.alerts.values())
+        return alert_ids
+    
+    alert_ids = asyncio.run(run())
+    
+    assert list(manager.alerts) == alert_ids[-5:]
+    assert manager._active_count == sum(not a.resolved for a in manager.alerts.values())
+    assert manager.get_stats()['active_alerts'] == manager._active_count
+
+
+if __name__ == "__main__":
+    test_slow_async_handler_times_out()
+    test_blocking_sync_handler_does_not_block_loop()
+    test_cancelled_handler_is_logged()
+    test_rule_cooldown()
+    test_active_count_after_eviction()
+    print("✅ 告警管理器测试通过")
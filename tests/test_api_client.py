@@ -0,0 +1,90 @@
+"""
+API客户端测试
+验证请求重试时重新签名与退避时间上限、多线程并发下的请求频率限制
+"""
+
+import sys
+import os
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.api_client import APIClient
+
+
+class _Response:
+    """测试用HTTP响应"""
+    
+    def __init__(self, status_code: int, data=None):
+        self.status_code = status_code
+        self.text = 'error' if status_code != 200 else ''
+        self._data = data or {}
+    
+    def json(self):
+        return self._data
+
+
+def test_retry_resigns_and_caps_backoff():
+    """每次重试重新生成时间戳和签名，退避时间不超过 max_retry_delay"""
+    client = APIClient('binance', 'key', 'secret', 'https://example.com')
+    client.max_retries = 5
+    client.retry_delay = 1
+    client.max_retry_delay = 3
+    
+    responses = [_Response(503)] * 5 + [_Response(200, {'ok': True})]
+    clock = itertools.count(1_700_000_000)  # 每次取时间前进1秒，不触发请求频率限制
+    
+    with mock.patch('core.api_client.requests.get', side_effect=responses) as get, \
+            mock.patch('core.api_client.time.time', side_effect=lambda: next(clock)), \
+            mock.patch('core.api_client.time.sleep') as sleep:
+        result = client._make_request('GET', '/api/v3/account', {'symbol': 'BTCUSDT'}, signed=True)
+    
+    assert result == {'ok': True}
+    assert get.call_count == 6
+    
+    timestamps = []
+    signatures = []
+    for call in get.call_args_list:
+        params = dict(parse_qsl(urlsplit(call.args[0]).query))
+        signature = params.pop('signature')
+        assert params['symbol'] == 'BTCUSDT'
+        assert signature == client._generate_signature(urlencode(params))
+        timestamps.append(params['timestamp'])
+        signatures.append(signature)
+    
+    assert len(set(timestamps)) == 6
+    assert len(set(signatures)) == 6
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2, 3, 3, 3]
+
+
+def test_throttle_spaces_concurrent_requests():
+    """多个线程并发调用同一客户端时，相邻请求间隔仍不少于 min_request_interval"""
+    client = APIClient('binance', 'key', 'secret', 'https://example.com')
+    client.min_request_interval = 0.05
+    sent = []
+    
+    def fake_get(url, headers=None, timeout=None):
+        sent.append(time.monotonic())
+        return _Response(200, {'ok': True})
+    
+    with mock.patch('core.api_client.requests.get', side_effect=fake_get):
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(
+                lambda _: client._make_request('GET', '/api/v3/ticker/price'), range(5)
+            ))
+    
+    assert results == [{'ok': True}] * 5
+    sent.sort()
+    gaps = [later - earlier for earlier, later in zip(sent, sent[1:])]
+    assert min(gaps) >= client.min_request_interval * 0.9
+
+
+if __name__ == "__main__":
+    test_retry_resigns_and_caps_backoff()
+    test_throttle_spaces_concurrent_requests()
+    print("✅ API客户端测试通过")
@@ -0,0 +1,143 @@
+"""
+日志管理器测试
+验证结构化日志的缓冲与刷新、审计事件直接落盘、退出刷新以及队列写日志模式
+"""
+
+import sys
+import os
+import time
+import logging
+import logging.handlers
+import tempfile
+from datetime import datetime
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.logger as logger_module
+from core.logger import LoggerManager
+
+
+def _read_lines(log_dir: str, event_type: str) -> list:
+    """读取某类结构化日志文件的全部行，文件不存在时返回空列表"""
+    path = os.path.join(log_dir, f"structured_{event_type}_{datetime.now().strftime('%Y%m%d')}.jsonl")
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return f.readlines()
+
+
+def _wait_until(condition, timeout: float = 2.0) -> bool:
+    """轮询等待条件成立"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def _create_manager(log_dir: str, **config) -> LoggerManager:
+    return LoggerManager(name="TestLogger", log_dir=log_dir,
+                         config={'console_output': False, **config})
+
+
+def test_buffer_flushes_by_count():
+    """缓冲条数达到 structured_buffer_size 时批量写入"""
+    with tempfile.TemporaryDirectory() as log_dir:
+        manager = _create_manager(log_dir, structured_buffer_size=3, structured_flush_interval=60)
+        
+        manager._log_structured_data('signal', {'n': 1})
+        manager._log_structured_data('signal', {'n': 2})
+        assert _read_lines(log_dir, 'signal') == []
+        
+        manager._log_structured_data('signal', {'n': 3})
+        assert len(_read_lines(log_dir, 'signal')) == 3
+        
+        manager.stop_structured_flusher()
+
+
+def test_buffer_flushes_by_time_with_one_thread():
+    """没有后续事件时由同一个后台线程在 structured_flush_interval 内落盘"""
+    with tempfile.TemporaryDirectory() as log_dir:
+        manager = _create_manager(log_dir, structured_flush_interval=0.05)
+        
+        manager._log_structured_data('signal', {'n': 1})
+        flusher = manager._structured_flusher
+        assert flusher is not None and flusher.is_alive()
+        assert _wait_until(lambda: len(_read_lines(log_dir, 'signal')) == 1)
+        
+        # 后续缓冲窗口复用同一线程，不再为每个窗口创建新线程
+        manager._log_structured_data('signal', {'n': 2})
+        assert _wait_until(lambda: len(_read_lines(log_dir, 'signal')) == 2)
+        assert manager._structured_flusher is flusher
+        
+        manager.stop_structured_flusher()
+        assert not flusher.is_alive()
+
+
+def test_audit_events_write_through():
+    """订单/成交/错误事件不经缓冲直接落盘，并带出之前缓冲的数据"""
+    with tempfile.TemporaryDirectory() as log_dir:
+        manager = _create_manager(log_dir, structured_flush_interval=60)
+        
+        manager._log_structured_data('signal', {'n': 1})
+        assert _read_lines(log_dir, 'signal') == []
+        
+        for event_type in ('order', 'fill', 'error'):
+            manager._log_structured_data(event_type, {'event': event_type})
+            assert len(_read_lines(log_dir, event_type)) == 1
+        
+        assert len(_read_lines(log_dir, 'signal')) == 1
+        
+        manager.stop_structured_flusher()
+
+
+def test_shutdown_flushes_buffer():
+    """进程退出钩子写入剩余缓冲，之后的结构化日志直接落盘"""
+    with tempfile.TemporaryDirectory() as log_dir:
+        manager = _create_manager(log_dir, structured_flush_interval=60)
+        
+        manager._log_structured_data('signal', {'n': 1})
+        manager._log_structured_data('signal', {'n': 2})
+        assert _read_lines(log_dir, 'signal') == []
+        
+        logger_module._shutdown_live_managers()
+        assert len(_read_lines(log_dir, 'signal')) == 2
+        assert not manager._structured_flusher.is_alive()
+        
+        manager._log_structured_data('signal', {'n': 3})
+        assert len(_read_lines(log_dir, 'signal')) == 3
+
+
+def test_queue_output_writes_via_listener():
+    """queue_output 模式下日志经队列由后台线程写入文件"""
+    with tempfile.TemporaryDirectory() as log_dir:
+        manager = _create_manager(log_dir, queue_output=True)
+        logger = manager.create_logger("queued")
+        
+        assert all(isinstance(handler, logging.handlers.QueueHandler) for handler in logger.handlers)
+        
+        logger.info("队列日志消息")
+        logger.error("队列错误消息")
+        manager.stop_queue_listeners()
+        
+        date = datetime.now().strftime('%Y%m%d')
+        with open(os.path.join(log_dir, f"queued_{date}.log"), encoding='utf-8') as f:
+            content = f.read()
+        with open(os.path.join(log_dir, f"queued_error_{date}.log"), encoding='utf-8') as f:
+            error_content = f.read()
+        
+        assert "队列日志消息" in content and "队列错误消息" in content
+        assert "队列错误消息" in error_content and "队列日志消息" not in error_content
+        
+        manager.stop_structured_flusher()
+
+
+if __name__ == "__main__":
+    test_buffer_flushes_by_count()
+    test_buffer_flushes_by_time_with_one_thread()
+    test_audit_events_write_through()
+    test_shutdown_flushes_buffer()
+    test_queue_output_writes_via_listener()
+    print("✅ 日志管理器测试通过")
@@ -0,0 +1,71 @@
+"""
+策略基类测试
+验证信号冷却时间与每小时频率限制的时间窗口
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from framework.signal import Signal, SignalType
+from framework.strategy_base import BaseStrategy
+
+
+class _Strategy(BaseStrategy):
+    """测试用策略"""
+    
+    async def calculate_indicators(self, data: pd.DataFrame, symbol: str) -> pd.DataFrame:
+        return data
+    
+    async def generate_signal(self, data: pd.DataFrame, symbol: str) -> Signal:
+        return None
+
+
+def _signal(symbol: str, age: timedelta) -> Signal:
+    """创建指定时间之前产生的信号"""
+    signal = Signal(SignalType.BUY, 0.8, 100.0, "测试", {'symbol': symbol})
+    signal.timestamp = datetime.now() - age
+    return signal
+
+
+def test_cooldown_window_with_backdated_signal():
+    """补录的较早信号落入冷却窗口时仍然生效"""
+    strategy = _Strategy("test", {'signal_cooldown': 300, 'max_signals_per_hour': 0})
+    
+    strategy.metrics.add_signal(_signal('ETHUSDT', timedelta(minutes=1)))
+    # 时间早于历史末尾的补录信号
+    strategy.metrics.add_signal(_signal('BTCUSDT', timedelta(minutes=2)))
+    strategy.metrics.add_signal(_signal('SOLUSDT', timedelta(minutes=10)))
+    
+    history = strategy.metrics.signal_history
+    assert [s.timestamp for s in history] == sorted(s.timestamp for s in history)
+    
+    new_signal = _signal('BTCUSDT', timedelta(0))
+    assert not strategy._validate_signal(new_signal, 'BTCUSDT')  # 2分钟前的信号仍在冷却期
+    assert strategy._validate_signal(new_signal, 'SOLUSDT')      # 10分钟前的信号已过冷却期
+
+
+def test_hourly_limit_window():
+    """每小时频率限制只统计最近一小时内的信号，包括补录信号"""
+    strategy = _Strategy("test", {'signal_cooldown': 0, 'max_signals_per_hour': 3})
+    
+    strategy.metrics.add_signal(_signal('BTCUSDT', timedelta(minutes=5)))
+    strategy.metrics.add_signal(_signal('BTCUSDT', timedelta(hours=2)))
+    strategy.metrics.add_signal(_signal('BTCUSDT', timedelta(minutes=30)))
+    
+    new_signal = _signal('BTCUSDT', timedelta(0))
+    assert strategy._validate_signal(new_signal, 'BTCUSDT')  # 最近一小时只有2个
+    
+    strategy.metrics.add_signal(_signal('BTCUSDT', timedelta(minutes=50)))
+    assert not strategy._validate_signal(new_signal, 'BTCUSDT')  # 最近一小时已达3个
+
+
+if __name__ == "__main__":
+    test_cooldown_window_with_backdated_signal()
+    test_hourly_limit_window()
+    print("✅ 策略基类测试通过")
@@ -0,0 +1,104 @@
+"""
+交易执行器测试
+验证停止流程的并发与异常处理
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+
+import pandas as pd
+
+# 添加项目路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.logger import LoggerManager
+from core.trading_executor import TradingExecutor, TradingState
+
+
+class _ConfigManager:
+    """测试用配置管理器"""
+    
+    def load_config(self, name):
+        return {
+            'api': {},
+            'trading': {'symbols': ['BTCUSDT'], 'update_interval': 0},
+            'risk_management': {}
+        }
+
+
+class _APIClient:
+    """测试用API客户端"""
+    
+    def get_open_orders(self, symbol=None):
+        return []
+
+
+class _Executor(TradingExecutor):
+    """记录停止流程执行次数的交易执行器"""
+    
+    def __init__(self, *args, fail_teardown: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.teardown_calls = 0
+        self.fail_teardown = fail_teardown
+    
+    def _init_api_client(self):
+        return _APIClient()
+    
+    async def generate_signals(self, symbol):
+        return {'signal': 0}
+    
+    async def get_market_data(self, *args):
+        return pd.DataFrame()
+    
+    async def _cancel_all_orders(self):
+        self.teardown_calls += 1
+        await asyncio.sleep(0.01)  # 让并发的停止调用在撤单期间进入
+        if self.fail_teardown:
+            raise RuntimeError("撤单失败")
+
+
+def _create_executor(**kwargs) -> _Executor:
+    logger_manager = LoggerManager(log_dir=tempfile.mkdtemp(), config={'console_output': False})
+    executor = _Executor(_ConfigManager(), logger_manager, **kwargs)
+    executor.state = TradingState.RUNNING
+    return executor
+
+
+def test_concurrent_stop_runs_teardown_once():
+    """并发调用 stop_trading 时只执行一次停止流程"""
+    executor = _create_executor()
+    
+    async def run():
+        await asyncio.gather(executor.stop_trading(), executor.stop_trading())
+    
+    asyncio.run(run())
+    
+    assert executor.teardown_calls == 1
+    assert executor.state == TradingState.STOPPED
+
+
+def test_failed_stop_does_not_stay_stopping():
+    """停止流程失败后状态置为 ERROR，并发等待方被唤醒，之后可再次停止"""
+    executor = _create_executor(fail_teardown=True)
+    
+    async def run():
+        await asyncio.wait_for(
+            asyncio.gather(executor.stop_trading(), executor.stop_trading()), timeout=1
+        )
+        assert executor.state == TradingState.ERROR
+        
+        executor.fail_teardown = False
+        await executor.stop_trading()
+    
+    asyncio.run(run())
+    
+    assert executor.teardown_calls == 2
+    assert executor.state == TradingState.STOPPED
+
+
+if __name__ == "__main__":
+    test_concurrent_stop_runs_teardown_once()
+    test_failed_stop_does_not_stay_stopping()
+    print("✅ 交易执行器测试通过")